@@ -7,11 +7,26 @@ This means we will have two integers, usually named something like
 i and j, or left and right which each represent an index of the array
 or string.
 '''
+import bisect
+import heapq
+import itertools
 import logging as log
-from Utility_Module import utility_decorator
+import operator
+import os
+import sys
+from array import array
+from collections import OrderedDict, defaultdict
+from Utility_Module import (cacheable, utility_decorator, lazy_import,
+                            pack_ragged, ragged_batch)
 
-#set logging level at debug
-log.basicConfig(level=log.INFO)
+# numpy is optional. When it is missing the vectorized paths fall back
+# to plain python. It is only imported once a vectorized path needs it,
+# see lazy_import.
+np = lazy_import("numpy")
+
+# module logger, configured by the application (or the __main__ block
+# below); the module itself never calls basicConfig.
+logger = log.getLogger(__name__)
 
 class TwoPointers:
 
@@ -21,7 +36,14 @@ class TwoPointers:
 
     # Test if two strings are palindrome
     @utility_decorator
+    @cacheable
     def is_palindrome(self, input_string : str) -> bool:
+        #bytes-like input is compared against a reversed memoryview of
+        #itself, which runs in C without copying the data.
+        if isinstance(input_string, (bytes, bytearray, memoryview)):
+            with memoryview(input_string) as view:
+                return view == view[::-1]
+
         #left index initialized to start index of string
         left_index = 0
         #right index initialized to start index of string
@@ -34,8 +56,8 @@ class TwoPointers:
         ''' 
         while (left_index < right_index):
             #Info on characters at first and last index
-            log.debug(f" Character at left index : {input_string[left_index]}")
-            log.debug(f" Character at right index : {input_string[right_index]}")
+            logger.debug(" Character at left index : %s", input_string[left_index])
+            logger.debug(" Character at right index : %s", input_string[right_index])
             
             # check if characters match and if not return false
             if (input_string[left_index] != input_string[right_index]):
@@ -50,6 +72,13 @@ class TwoPointers:
         #directions have matched. So return true.
         return True
 
+    '''
+    Build a PalindromeIndex over a document to answer many substring
+    palindrome queries, see PalindromeIndex.
+    '''
+    def build_palindrome_index(self, input_string : str):
+        return PalindromeIndex(input_string)
+
     '''
     Below method checks if pair of integers in the passed array
     sum up to target.
@@ -61,6 +90,7 @@ class TwoPointers:
           O(n) time complexity.
     '''
     @utility_decorator
+    @cacheable
     def check_for_target_sum(self, arr1 : list[int],
                               target_sum : int) -> bool:
         #check if list is empty raise error
@@ -71,7 +101,7 @@ class TwoPointers:
         left_index = 0
         #right index to be initialized to end index of list
         right_index = len(arr1) - 1
-        log.info(f"target sum is : {target_sum}")
+        logger.debug("target sum is : %s", target_sum)
 
         '''
         This algorithm uses O(1 space complexity and O(n)
@@ -80,12 +110,12 @@ class TwoPointers:
         #Use while loop to iterate
         while (left_index < right_index):
             #debug info of integers at first and last index
-            log.debug(f"left side value : {arr1[left_index]}")
-            log.debug(f"right side value : {arr1[right_index]}")
+            logger.debug("left side value : %s", arr1[left_index])
+            logger.debug("right side value : %s", arr1[right_index])
             
             #add up the value of integers at left amd right index.
             curr_sum = arr1[left_index] + arr1[right_index]
-            log.info(f"current sum is : {curr_sum}")
+            logger.debug("current sum is : %s", curr_sum)
             
             # check if value is equal to target_sum
             if ( curr_sum == target_sum ):
@@ -103,6 +133,21 @@ class TwoPointers:
         # if the passed target_sum does not add up to passed integers.
         return False
 
+    '''
+    Answer a whole list of target sums over one array.
+        * Returns a matching (i, j) index pair (i < j, indexes into arr1)
+          for every target, or None when no pair adds up to it.
+        * arr1 doesn't have to be sorted. See TargetSumIndex for the
+          modes; build a TargetSumIndex directly to reuse the sorting or
+          hashing across calls on the same array.
+    '''
+    @utility_decorator
+    @cacheable
+    def check_for_target_sums(self, arr1 : list[int],
+                              target_sums : list[int],
+                              mode : str = "sorted") -> list:
+        return TargetSumIndex(arr1, mode).find_pairs(target_sums)
+
     '''
     Below function defines a combined sorted array from two iterales.
         * If we apendnd both the arrays and sort it will be
@@ -111,6 +156,7 @@ class TwoPointers:
           space complexity.
     '''
     @utility_decorator
+    @cacheable
     def combine_sorted_array(self, arr1 : list[int],
                               arr2 : list[int]) -> list[int]:
         #initialize the indexes.
@@ -118,45 +164,217 @@ class TwoPointers:
         #inititialize resultant sorted list
         sorted_list = []
 
-        log.debug(f"arr1 list is : {arr1}")
-        log.debug(f"arr2 list is : {arr2}")
+        logger.debug("arr1 list is : %s", arr1)
+        logger.debug("arr2 list is : %s", arr2)
+
+        #lengths don't change, so look them up once.
+        arr1_length = len(arr1)
+        arr2_length = len(arr2)
 
         #Iterate both the lists till one gets exhausted. 
         #Then append the rest.
-        while ( arr1_index < len(arr1) and 
-               arr2_index < len(arr2) ):
+        while ( arr1_index < arr1_length and 
+               arr2_index < arr2_length ):
             '''
             compare both lists to find which element is lesser
             at that particular index and add it to list and increment
             that index.
             '''
             if ( arr1[arr1_index] < arr2[arr2_index] ):
-                
-                log.debug(f"arr1 element is : {arr1[arr1_index]}")
-                log.debug(f"arr2 element is : {arr2[arr2_index]}")
-
-                log.info(f"Appending {arr1[arr1_index]}")
                 sorted_list.append(arr1[arr1_index])
                 arr1_index += 1
             else:
-                log.info(f"Appending {arr2[arr2_index]}")
                 sorted_list.append(arr2[arr2_index])
                 arr2_index += 1
         
-        #If arr1 still has elements append them
-        while ( arr1_index < len(arr1) ):
-            log.info(f"Appending {arr1[arr1_index]}")
-            sorted_list.append(arr1[arr1_index])
-            arr1_index += 1
-
-         #If arr2 still has elements append them
-        while ( arr2_index < len(arr2) ):
-            log.info(f"Appending {arr2[arr2_index]}")
-            sorted_list.append(arr2[arr2_index])  
-            arr2_index += 1
+        #Only one of the lists still has elements. Copy the rest of
+        #both in bulk with slices instead of one append at a time.
+        sorted_list.extend(arr1[arr1_index:])
+        sorted_list.extend(arr2[arr2_index:])
 
         return sorted_list        
 
+    '''
+    K-way merge of any number of sorted inputs.
+        * Each source is an iterable of ints, or the path of a text file
+          with one int per line (a sorted shard file).
+        * The heads of all sources sit in a heap, so each output element
+          costs O(log k) for k sources, against O(n * k) for merging the
+          sources two at a time with combine_sorted_array.
+        * Output is yielded lazily, only one element per source is held.
+    '''
+    def merge_sorted_iterables(self, *sources):
+        return heapq.merge(*(_iter_sorted_source(source)
+                             for source in sources))
+
+    '''
+    Adaptive version of combine_sorted_array for inputs of very different
+    sizes, such as merging a small delta into a large sorted base.
+        * Instead of one comparison per element it gallops: from the
+          current position it probes 1, 2, 4, ... elements ahead until it
+          passes the other input's head, then binary searches that last
+          step. The whole run found that way is copied with one slice.
+          Merging m elements into n costs O(m log(n / m)) comparisons.
+        * Equal values keep arr1's before arr2's.
+        * Lists and array.array inputs return a list (an array when both
+          are arrays). When numpy is available and an input or out is an
+          ndarray, every element's output position is computed at once
+          with searchsorted and placed with one fancy index assignment.
+        * With out (a list, array or ndarray of at least
+          len(arr1) + len(arr2) items) the result is written into out
+          and the number of items written is returned.
+    '''
+    @utility_decorator
+    def combine_sorted_array_adaptive(self, arr1, arr2, out=None):
+        if _use_numpy(arr1, arr2, out):
+            arr1, arr2 = np.asarray(arr1), np.asarray(arr2)
+            return _numpy_output(out, _numpy_merge(arr1, arr2))
+
+        writer = _SortedWriter(out, arr1, arr2)
+        arr1_index = arr2_index = 0
+        arr1_length = len(arr1)
+        arr2_length = len(arr2)
+        while ( arr1_index < arr1_length and arr2_index < arr2_length ):
+            #run of arr1 up to and including the head of arr2
+            end = _gallop_right(arr1, arr2[arr2_index], arr1_index)
+            writer.extend(arr1[arr1_index:end])
+            arr1_index = end
+            if ( arr1_index == arr1_length ):
+                break
+            #run of arr2 strictly below the head of arr1
+            end = _gallop_left(arr2, arr1[arr1_index], arr2_index)
+            writer.extend(arr2[arr2_index:end])
+            arr2_index = end
+
+        writer.extend(arr1[arr1_index:])
+        writer.extend(arr2[arr2_index:])
+        return writer.result()
+
+    '''
+    Sorted set operations on the same galloping machinery. Inputs are
+    sorted and may repeat values, which are counted like a multiset
+    (as C++ std::set_intersection and friends do): a value in arr1 c1
+    times and in arr2 c2 times appears min(c1, c2) times in the
+    intersection, max(c1, c2) times in the union and c1 - c2 times in
+    the difference. Inputs, outputs and out work as for
+    combine_sorted_array_adaptive; out only needs room for the result.
+    '''
+    @utility_decorator
+    def sorted_intersection(self, arr1, arr2, out=None):
+        if _use_numpy(arr1, arr2, out):
+            arr1, arr2 = np.asarray(arr1), np.asarray(arr2)
+            return _numpy_output(out, arr1[_numpy_matched(arr1, arr2)])
+
+        writer = _SortedWriter(out, arr1, arr2)
+        arr1_index = arr2_index = 0
+        while ( arr1_index < len(arr1) and arr2_index < len(arr2) ):
+            value1 = arr1[arr1_index]
+            value2 = arr2[arr2_index]
+            if ( value1 < value2 ):
+                arr1_index = _gallop_left(arr1, value2, arr1_index)
+            elif ( value2 < value1 ):
+                arr2_index = _gallop_left(arr2, value1, arr2_index)
+            else:
+                writer.append(value1)
+                arr1_index += 1
+                arr2_index += 1
+        return writer.result()
+
+    @utility_decorator
+    def sorted_union(self, arr1, arr2, out=None):
+        if _use_numpy(arr1, arr2, out):
+            arr1, arr2 = np.asarray(arr1), np.asarray(arr2)
+            extra = arr2[~_numpy_matched(arr2, arr1)]
+            return _numpy_output(out, _numpy_merge(arr1, extra))
+
+        writer = _SortedWriter(out, arr1, arr2)
+        arr1_index = arr2_index = 0
+        while ( arr1_index < len(arr1) and arr2_index < len(arr2) ):
+            value1 = arr1[arr1_index]
+            value2 = arr2[arr2_index]
+            if ( value1 < value2 ):
+                end = _gallop_left(arr1, value2, arr1_index)
+                writer.extend(arr1[arr1_index:end])
+                arr1_index = end
+            elif ( value2 < value1 ):
+                end = _gallop_left(arr2, value1, arr2_index)
+                writer.extend(arr2[arr2_index:end])
+                arr2_index = end
+            else:
+                writer.append(value1)
+                arr1_index += 1
+                arr2_index += 1
+        writer.extend(arr1[arr1_index:])
+        writer.extend(arr2[arr2_index:])
+        return writer.result()
+
+    # Values of arr1 that are not in arr2.
+    @utility_decorator
+    def sorted_difference(self, arr1, arr2, out=None):
+        if _use_numpy(arr1, arr2, out):
+            arr1, arr2 = np.asarray(arr1), np.asarray(arr2)
+            return _numpy_output(out, arr1[~_numpy_matched(arr1, arr2)])
+
+        writer = _SortedWriter(out, arr1, arr2)
+        arr1_index = arr2_index = 0
+        while ( arr1_index < len(arr1) and arr2_index < len(arr2) ):
+            value1 = arr1[arr1_index]
+            value2 = arr2[arr2_index]
+            if ( value1 < value2 ):
+                end = _gallop_left(arr1, value2, arr1_index)
+                writer.extend(arr1[arr1_index:end])
+                arr1_index = end
+            elif ( value2 < value1 ):
+                arr2_index = _gallop_left(arr2, value1, arr2_index)
+            else:
+                arr1_index += 1
+                arr2_index += 1
+        writer.extend(arr1[arr1_index:])
+        return writer.result()
+
+    '''
+    External merge sort with bounded memory.
+        * values is read run_size items at a time. Each run is sorted in
+          memory and spilled to a temporary file of int64 values in one
+          bulk write.
+        * The runs are then merged with merge_sorted_iterables, reading
+          each run back buffer_items values at a time. When there are
+          more than max_open_runs runs they are first merged in groups,
+          so the number of open files and read buffers stays bounded.
+        * Sorted values are yielded lazily and the temporary files are
+          removed once the generator finishes or is closed.
+    '''
+    def external_sort(self, values, run_size : int = 1 << 20,
+                      buffer_items : int = 1 << 16,
+                      max_open_runs : int = 64, temp_dir : str = None):
+        if ( run_size <= 0 or buffer_items <= 0 or max_open_runs < 2 ):
+            raise ValueError("run_size, buffer_items must be positive "
+                             "and max_open_runs at least 2")
+        run_paths = []
+        try:
+            values = iter(values)
+            run = array("q", sorted(itertools.islice(values, run_size)))
+            while run:
+                run_paths.append(_spill_run(run, temp_dir))
+                run = array("q", sorted(itertools.islice(values, run_size)))
+
+            #merge groups of runs until they can all be opened at once.
+            while ( len(run_paths) > max_open_runs ):
+                group = run_paths[:max_open_runs]
+                merged = self.merge_sorted_iterables(
+                            *(_read_run(path, buffer_items) for path in group))
+                merged_path = _spill_run(merged, temp_dir, buffer_items)
+                for path in group:
+                    os.remove(path)
+                run_paths = run_paths[max_open_runs:] + [merged_path]
+
+            yield from self.merge_sorted_iterables(
+                *(_read_run(path, buffer_items) for path in run_paths))
+        finally:
+            for path in run_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
     '''
     test if string is in sub-sequence method.
         * we need to check if the characters of "s" appear in the same
@@ -166,10 +384,11 @@ class TwoPointers:
         * Using two pointers it will be O(1) space and O(n) time complexity.
     '''
     @utility_decorator
+    @cacheable
     def is_subsequence(self, source_str : str, target_str : str) -> bool:
         # print source and target strings
-        log.debug(f"Source string is : {source_str}")
-        log.debug(f"Target string is : {target_str}")
+        logger.debug("Source string is : %s", source_str)
+        logger.debug("Target string is : %s", target_str)
 
         source_str_index = target_str_index = 0
 
@@ -182,8 +401,8 @@ class TwoPointers:
         while ( source_str_index < len(source_str) 
             and target_str_index < len(target_str) ):
             #logging the characters
-            log.debug(f" source_str char at {source_str_index} is : {source_str[source_str_index]}")
-            log.debug(f" target_str char at {target_str_index} is : {target_str[target_str_index]}")
+            logger.debug(" source_str char at %s is : %s", source_str_index, source_str[source_str_index])
+            logger.debug(" target_str char at %s is : %s", target_str_index, target_str[target_str_index])
 
             #check for match
             if ( source_str[source_str_index] == target_str[target_str_index] ):
@@ -195,18 +414,36 @@ class TwoPointers:
         #subsequence condition has been acheived.
         return (source_str_index == len( source_str ))
 
+    '''
+    Check many source strings against the same target string.
+        * The target is preprocessed once into a SubsequenceIndex and
+          indexes are cached per target, so repeated calls with the same
+          document skip the preprocessing too.
+    '''
+    @utility_decorator
+    @cacheable
+    def is_subsequence_batch(self, source_strs : list[str],
+                             target_str : str) -> list[bool]:
+        return get_subsequence_index(target_str).is_subsequence_many(
+                    source_strs)
+
     '''
         * This method will reverse the string.
         * The input string is given as an array of characters s.
         * The challenge is to modify input array with o[1] extra memory
+        * bytearray, writable memoryview, array.array and numpy buffers
+          are reversed in place by reverse_buffer instead.
     '''
     @utility_decorator
     def reverse_string(self, source_str : list[str] ) -> str:
-        log.debug("source string is : {source_str}")
+        logger.debug("source string is : %s", source_str)
 
         #raise error if list is empty.
         if ( len(source_str) == 0):
             raise ValueError("Source string cannot be empty")
+
+        if not isinstance(source_str, list):
+            return self.reverse_buffer(source_str)
         
         i = 0
         j = len(source_str) - 1
@@ -214,13 +451,53 @@ class TwoPointers:
         #Iterate through the loop and assign
         while (i < j):            
             source_str[i], source_str[j] = source_str[j], source_str[i]
-            log.debug(f"char at {i} is : {source_str[i]}")
-            log.debug(f"char at {j} is : {source_str[j]}")
+            logger.debug("char at %s is : %s", i, source_str[i])
+            logger.debug("char at %s is : %s", j, source_str[j])
             i += 1
             j -= 1
  
         return source_str
 
+    '''
+    In place reversal of a writable buffer.
+        * Works on bytearray, writable memoryview, array.array and one
+          dimensional numpy arrays, reversing items (not bytes).
+        * Only [start, stop) is reversed, or with block_size every block
+          of block_size items in that range separately (the last block
+          may be shorter).
+        * A whole bytearray / array.array is reversed by its own C
+          reverse(). Otherwise the two ends are swapped a chunk at a time
+          with slice assignment, so the only extra memory is one chunk,
+          never a copy of the buffer.
+    '''
+    @utility_decorator
+    def reverse_buffer(self, buffer, start : int = 0, stop : int = None,
+                       block_size : int = None):
+        if np is not None and isinstance(buffer, np.ndarray):
+            if ( buffer.ndim != 1 ):
+                raise ValueError("Only one dimensional buffers are supported")
+            if not buffer.flags.writeable:
+                raise TypeError("Buffer must be writable")
+            _reverse_ranges(buffer, start, stop, block_size,
+                            lambda part: part.copy())
+            return buffer
+
+        whole = start == 0 and stop is None and block_size is None
+        if whole and isinstance(buffer, (bytearray, array)):
+            buffer.reverse()
+            return buffer
+
+        with memoryview(buffer) as view:
+            if view.readonly:
+                raise TypeError("Buffer must be writable")
+            if ( view.ndim != 1 ):
+                raise ValueError("Only one dimensional buffers are supported")
+            item_format = view.format
+            _reverse_ranges(view, start, stop, block_size,
+                            lambda part: memoryview(part.tobytes()).cast(
+                                item_format))
+        return buffer
+
     '''
     Squares of a Sorted Array
         * Given an integer array nums sorted in non-decreasing order, 
@@ -231,17 +508,18 @@ class TwoPointers:
         approach?
     '''
     @utility_decorator
+    @cacheable
     def squares_of_sorted_array(self, input_arr : list[int]) -> list[int]:
         '''
         * Use the two pointer approach to square compare and
           move the pointers.
         '''
-        log.info(f"input list is : {input_arr}")
+        logger.debug("input list is : %s", input_arr)
 
         # #moderate approach
         # #Time complexity is O(n log(n))
         # #Space complexity is O(n)
-        # log.info("Ending squares_of_sorted_array method : ")
+        # logger.info("Ending squares_of_sorted_array method : ")
         # #use list comprehension and sorted
         # return sorted( x*x for x in input_arr)
 
@@ -250,13 +528,13 @@ class TwoPointers:
             raise ValueError("List cant be empty")
         
         input_arr_len = len(input_arr)
-        log.debug(f"i/p array length : {input_arr_len}")
+        logger.debug("i/p array length : %s", input_arr_len)
         left_index = 0
         right_index = input_arr_len - 1
         
         #initializing sorted list with 0 of input array length.
         squares_of_sorted_list = [0] * input_arr_len
-        log.debug(f"sorted array length : {len(squares_of_sorted_list)}")
+        logger.debug("sorted array length : %s", len(squares_of_sorted_list))
 
         '''
         The key is non-decreasing numbers. it means negative
@@ -269,8 +547,8 @@ class TwoPointers:
         '''
         for i in range(input_arr_len - 1, -1, -1):
             
-            log.debug(f"left element : {abs(input_arr[left_index])}")
-            log.debug(f"right element : {abs(input_arr[right_index])}")
+            logger.debug("left element : %s", abs(input_arr[left_index]))
+            logger.debug("right element : %s", abs(input_arr[right_index]))
 
             #Compare absolute values at left and right pointers
             if ( abs(input_arr[left_index]) 
@@ -290,24 +568,599 @@ class TwoPointers:
         
         return squares_of_sorted_list
 
-        
+    '''
+    numpy version of squares_of_sorted_array.
+        * Binary search finds where the non-negative values start. The
+          negative half reversed and the non-negative half both square
+          to ascending runs, which are merged in bulk: searchsorted gives
+          where each negative square lands among the others.
+        * Fixed width integers are checked for overflow up front: the
+          largest square comes from the first or the last element, so
+          OverflowError is raised if that doesn't fit the dtype.
+        * Falls back to squares_of_sorted_array without numpy, and for
+          lists whose squares don't fit in int64.
+    '''
+    @utility_decorator
+    @cacheable
+    def squares_of_sorted_array_vectorized(self, input_arr):
+        if ( len(input_arr) == 0 ):
+            raise ValueError("List cant be empty")
+
+        arr = None if np is None else np.asarray(input_arr)
+        if arr is None or arr.dtype.kind not in "iuf":
+            return self.squares_of_sorted_array(list(input_arr))
+
+        if arr.dtype.kind in "iu":
+            largest = max(abs(int(arr[0])), abs(int(arr[-1])))
+            if ( largest * largest > np.iinfo(arr.dtype).max ):
+                #lists were only converted by us, keep them exact.
+                if not isinstance(input_arr, np.ndarray):
+                    return self.squares_of_sorted_array(list(input_arr))
+                raise OverflowError(f"square of {largest} doesn't fit "
+                                    f"in {arr.dtype}")
+
+        split = int(np.searchsorted(arr, 0))
+        negative_squares = np.square(arr[:split][::-1])
+        positive_squares = np.square(arr[split:])
+
+        #position of each negative square in the merged output: its rank
+        #among the positive squares plus the negative squares before it.
+        negative_positions = (np.searchsorted(positive_squares,
+                                              negative_squares)
+                              + np.arange(split))
+        squares = np.empty(len(arr), dtype=positive_squares.dtype)
+        is_negative = np.zeros(len(arr), dtype=bool)
+        is_negative[negative_positions] = True
+        squares[is_negative] = negative_squares
+        squares[~is_negative] = positive_squares
+        return squares
+
+    '''
+    Yield the squares of a sorted array in ascending order without
+    building the output.
+        * Binary search finds the first non-negative value. From there
+          two pointers walk outwards, one into the negatives and one into
+          the non-negatives, always yielding the smaller square.
+        * Works on any sorted sequence with len() and indexing.
+    '''
+    def iter_squares_of_sorted_array(self, input_arr):
+        split = bisect.bisect_left(input_arr, 0)
+        left_index = split - 1
+        right_index = split
+        input_arr_len = len(input_arr)
+
+        while ( left_index >= 0 and right_index < input_arr_len ):
+            if ( -input_arr[left_index] < input_arr[right_index] ):
+                square = input_arr[left_index]
+                left_index -= 1
+            else:
+                square = input_arr[right_index]
+                right_index += 1
+            yield square * square
+
+        while ( left_index >= 0 ):
+            yield input_arr[left_index] * input_arr[left_index]
+            left_index -= 1
+        while ( right_index < input_arr_len ):
+            yield input_arr[right_index] * input_arr[right_index]
+            right_index += 1
+
+    '''
+    Batch versions for many small inputs, stored as one flat buffer plus
+    offsets: input i is values[offsets[i]:offsets[i+1]] (see
+    Utility_Module.pack_ragged). values is bytes for byte strings or
+    ints otherwise. The inputs run in a tight loop with no per input
+    logging, optionally over processes through shared memory, and the
+    answers come back as an array('b') of 0 / 1, one per input.
+    '''
+    @utility_decorator
+    @cacheable
+    def is_palindrome_batch(self, values, offsets,
+                            processes : int = 1) -> array:
+        typecode = "B" if isinstance(values, (bytes, bytearray)) else "q"
+        return ragged_batch(_palindrome_kernel, values, offsets,
+                            typecode=typecode, result_typecode="b",
+                            processes=processes)
+
+    # Every input has to be sorted, like for check_for_target_sum.
+    @utility_decorator
+    @cacheable
+    def check_for_target_sum_batch(self, values, offsets, target_sum : int,
+                                   processes : int = 1) -> array:
+        if any(start == stop for start, stop in zip(offsets, offsets[1:])):
+            raise ValueError("List cant be empty")
+        return ragged_batch(_target_sum_kernel, values, offsets,
+                            (target_sum,), result_typecode="b",
+                            processes=processes)
+
 
                 
-def test_class_methods():
+'''
+Preprocessed target string for is_subsequence queries.
+    * For every character the sorted positions of it in the target are
+      stored once, which is O(n) time and space. They are kept in
+      array('I') (array('q') past 4G characters), about 4 bytes per
+      character instead of a boxed int per position.
+    * A query walks the source string and, for each character, binary
+      searches the first position after the previous match. That is
+      O(m log n) for a source of length m instead of O(n) per query.
+'''
+class SubsequenceIndex:
+
+    #Constructor method
+    def __init__(self, target_str : str):
+        self.target_length = len(target_str)
+        typecode = "I" if len(target_str) < 1 << 32 else "q"
+        positions = defaultdict(lambda: array(typecode))
+        for index, char in enumerate(target_str):
+            positions[char].append(index)
+        self.positions = dict(positions)
+
+    # memory held by the position arrays
+    @property
+    def nbytes(self) -> int:
+        return sum(char_positions.itemsize * len(char_positions)
+                   for char_positions in self.positions.values())
+
+    def is_subsequence(self, source_str : str) -> bool:
+        #first target position the next character may match at
+        next_position = 0
+        for char in source_str:
+            char_positions = self.positions.get(char)
+            if not char_positions:
+                return False
+            i = bisect.bisect_left(char_positions, next_position)
+            if ( i == len(char_positions) ):
+                return False
+            next_position = char_positions[i] + 1
+        return True
+
+    def is_subsequence_many(self, source_strs) -> list[bool]:
+        return [self.is_subsequence(source_str)
+                for source_str in source_strs]
+
+# bytes of indexes and their target strings get_subsequence_index keeps
+SUBSEQUENCE_CACHE_BYTES = 256 << 20
+
+# target string -> (SubsequenceIndex, bytes it holds), least recent first
+_subsequence_indexes = OrderedDict()
+_subsequence_cache_bytes = 0
+
+# Cached SubsequenceIndex per target string, least recently used ones
+# dropped once the indexes and targets pass SUBSEQUENCE_CACHE_BYTES.
+# Strings cache their own hash, so looking up a multi megabyte target
+# again is cheap.
+def get_subsequence_index(target_str : str) -> SubsequenceIndex:
+    global _subsequence_cache_bytes
+    cached = _subsequence_indexes.get(target_str)
+    if cached is not None:
+        _subsequence_indexes.move_to_end(target_str)
+        return cached[0]
+
+    subsequence_index = SubsequenceIndex(target_str)
+    size = subsequence_index.nbytes + sys.getsizeof(target_str)
+    if ( size > SUBSEQUENCE_CACHE_BYTES ):
+        return subsequence_index
+    _subsequence_indexes[target_str] = (subsequence_index, size)
+    _subsequence_cache_bytes += size
+    while ( _subsequence_cache_bytes > SUBSEQUENCE_CACHE_BYTES ):
+        _, (_, evicted_size) = _subsequence_indexes.popitem(last=False)
+        _subsequence_cache_bytes -= evicted_size
+    return subsequence_index
+
+# values and targets below this in size can't overflow int64 arithmetic
+_SAFE_INT64 = 1 << 62
+
+'''
+Reusable index for pair sum queries over one array.
+    * mode="sorted" sorts the indexes of the array by value once. With
+      numpy each target is answered by one vectorized binary search of
+      (target - value) for every value, without numpy (or when values
+      or the target are too large for int64 arithmetic) by the usual
+      two pointer walk over the sorted values.
+    * mode="hash" keeps the first two indexes of every value in a dict
+      and answers a target with one pass of lookups. No sorting needed.
+    * Either way the array is sorted or hashed only once, when the index
+      is built, and every find_pair call reuses it.
+'''
+class TargetSumIndex:
+
+    #Constructor method
+    def __init__(self, arr1 : list[int], mode : str = "sorted"):
+        if ( len(arr1) == 0 ):
+            raise ValueError("List cant be empty")
+        if mode not in ("sorted", "hash"):
+            raise ValueError(f"Unknown mode : {mode}")
+        self.mode = mode
+
+        if ( mode == "hash" ):
+            self.values = list(arr1)
+            self.first_indexes = {}
+            for index, value in enumerate(self.values):
+                indexes = self.first_indexes.setdefault(value, [])
+                if ( len(indexes) < 2 ):
+                    indexes.append(index)
+        elif np is not None:
+            values = np.asarray(arr1)
+            self.order = np.argsort(values, kind="stable")
+            self.sorted_values = values[self.order]
+            # int64 sums and differences only can't wrap when the values
+            # stay well inside the range; anything else (huge python
+            # ints, uint64) goes through the two pointer walk.
+            kind = values.dtype.kind
+            self.vectorized = kind == "f" or ( kind in "iu" and
+                -_SAFE_INT64 < int(self.sorted_values[0]) and
+                int(self.sorted_values[-1]) < _SAFE_INT64 )
+            self.sorted_list = None
+        else:
+            self.order = sorted(range(len(arr1)), key=arr1.__getitem__)
+            self.sorted_values = [arr1[index] for index in self.order]
+
+    def find_pair(self, target_sum : int):
+        if ( self.mode == "hash" ):
+            return self._find_pair_hash(target_sum)
+        if ( np is not None and self.vectorized
+             and abs(target_sum) < _SAFE_INT64 ):
+            return self._find_pair_vectorized(target_sum)
+        return self._find_pair_two_pointer(target_sum)
+
+    def find_pairs(self, target_sums) -> list:
+        return [self.find_pair(target_sum) for target_sum in target_sums]
+
+    def _find_pair_hash(self, target_sum):
+        for index, value in enumerate(self.values):
+            indexes = self.first_indexes.get(target_sum - value)
+            if indexes is None:
+                continue
+            # the partner can't be the element itself
+            for other in indexes:
+                if ( other != index ):
+                    return min(index, other), max(index, other)
+        return None
+
+    def _find_pair_two_pointer(self, target_sum):
+        sorted_values = self.sorted_values
+        if np is not None and isinstance(sorted_values, np.ndarray):
+            # python ints, so the sums are exact
+            if self.sorted_list is None:
+                self.sorted_list = sorted_values.tolist()
+            sorted_values = self.sorted_list
+        left_index = 0
+        right_index = len(sorted_values) - 1
+        while ( left_index < right_index ):
+            curr_sum = sorted_values[left_index] + sorted_values[right_index]
+            if ( curr_sum == target_sum ):
+                return self._original_pair(left_index, right_index)
+            if ( curr_sum > target_sum ):
+                right_index -= 1
+            else:
+                left_index += 1
+        return None
+
+    def _find_pair_vectorized(self, target_sum):
+        sorted_values = self.sorted_values
+        complements = target_sum - sorted_values
+        # search right so equal values land after the element itself,
+        # then step back one to the last value <= complement.
+        partners = np.searchsorted(sorted_values, complements,
+                                   side="right") - 1
+        positions = np.arange(len(sorted_values))
+        # pair each element with a different position holding the
+        # complement: the last equal value, or the one before it when
+        # that is the element itself.
+        partners = np.where(partners == positions, partners - 1, partners)
+        valid = partners >= 0
+        matches = valid & (sorted_values[np.where(valid, partners, 0)]
+                           == complements)
+        found = np.flatnonzero(matches)
+        if ( len(found) == 0 ):
+            return None
+        position = int(found[0])
+        return self._original_pair(position, int(partners[position]))
+
+    def _original_pair(self, left_position, right_position):
+        left_index = int(self.order[left_position])
+        right_index = int(self.order[right_position])
+        return min(left_index, right_index), max(left_index, right_index)
+
+'''
+Palindrome index over a string or bytes-like document (Manacher).
+    * Built once in O(n): odd_radius[c] is how far the longest odd
+      palindrome centered at c reaches (counting c itself), and
+      even_radius[c] the half length of the longest even palindrome
+      centered just before c.
+    * Is text[i:j] a palindrome is then O(1): it is exactly when the
+      palindrome around its center reaches at least half its length.
+    * longest() gives the longest palindromic substring as (start, end),
+      end exclusive. Radii are stored in array('q') to keep them compact.
+'''
+class PalindromeIndex:
+
+    #Constructor method
+    def __init__(self, input_string):
+        if isinstance(input_string, (bytearray, memoryview)):
+            input_string = bytes(input_string)
+        self.length = length = len(input_string)
+        self.odd_radius = odd_radius = array("q", bytes(8 * length))
+        self.even_radius = even_radius = array("q", bytes(8 * length))
+
+        #odd length palindromes. [left, right] is the rightmost
+        #palindrome found so far.
+        left = 0
+        right = -1
+        for center in range(length):
+            radius = 1
+            if ( center <= right ):
+                radius = min(odd_radius[left + right - center],
+                             right - center + 1)
+            while ( center - radius >= 0 and center + radius < length
+                    and input_string[center - radius]
+                        == input_string[center + radius] ):
+                radius += 1
+            odd_radius[center] = radius
+            if ( center + radius - 1 > right ):
+                left = center - radius + 1
+                right = center + radius - 1
+
+        #even length palindromes, centered between center - 1 and center.
+        left = 0
+        right = -1
+        for center in range(length):
+            radius = 0
+            if ( center <= right ):
+                radius = min(even_radius[left + right - center + 1],
+                             right - center + 1)
+            while ( center - radius - 1 >= 0 and center + radius < length
+                    and input_string[center - radius - 1]
+                        == input_string[center + radius] ):
+                radius += 1
+            even_radius[center] = radius
+            if ( center + radius - 1 > right ):
+                left = center - radius
+                right = center + radius - 1
+
+    # True when input_string[start:end] is a palindrome.
+    def is_palindrome(self, start : int, end : int) -> bool:
+        if not ( 0 <= start <= end <= self.length ):
+            raise IndexError("substring range out of bounds")
+        sub_length = end - start
+        if ( sub_length <= 1 ):
+            return True
+        center = start + sub_length // 2
+        if ( sub_length % 2 ):
+            return self.odd_radius[center] >= sub_length // 2 + 1
+        return self.even_radius[center] >= sub_length // 2
+
+    def is_palindrome_many(self, ranges) -> list[bool]:
+        return [self.is_palindrome(start, end) for start, end in ranges]
+
+    def longest(self) -> tuple[int, int]:
+        best_start = best_end = 0
+        for center in range(self.length):
+            radius = self.odd_radius[center]
+            if ( 2 * radius - 1 > best_end - best_start ):
+                best_start = center - radius + 1
+                best_end = center + radius
+            radius = self.even_radius[center]
+            if ( 2 * radius > best_end - best_start ):
+                best_start = center - radius
+                best_end = center + radius
+        return best_start, best_end
+
+# items swapped per slice assignment in _reverse_range
+REVERSE_CHUNK_ITEMS = 1 << 16
+
+# Reverse [start, stop) of items, or every block_size block of it.
+def _reverse_ranges(items, start, stop, block_size, copy_part):
+    stop = len(items) if stop is None else stop
+    if not ( 0 <= start <= stop <= len(items) ):
+        raise IndexError("reverse range out of bounds")
+    if block_size is None:
+        _reverse_range(items, start, stop, copy_part)
+        return
+    if ( block_size <= 0 ):
+        raise ValueError("block_size must be positive")
+    for block_start in range(start, stop, block_size):
+        _reverse_range(items, block_start,
+                       min(block_start + block_size, stop), copy_part)
+
+# Swap the two ends of items[left:right] chunk by chunk. The chunks
+# never overlap, so only the left chunk needs a temporary copy.
+def _reverse_range(items, left, right, copy_part):
+    while ( right - left > 1 ):
+        size = min(REVERSE_CHUNK_ITEMS, (right - left) // 2)
+        left_part = copy_part(items[left:left + size])
+        items[left:left + size] = items[right - size:right][::-1]
+        items[right - size:right] = left_part[::-1]
+        left += size
+        right -= size
+
+# Sorted ints from an iterable or from a text file with one int per line.
+def _iter_sorted_source(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as file:
+            for line in file:
+                if line.strip():
+                    yield int(line)
+    else:
+        yield from source
+
+# Write sorted int64 values to a new temporary file, buffer_items at a
+# time, and return its path.
+def _spill_run(values, temp_dir=None, buffer_items=1 << 16):
+    import tempfile
+
+    file_descriptor, path = tempfile.mkstemp(suffix=".run", dir=temp_dir)
+    with os.fdopen(file_descriptor, "wb") as file:
+        if isinstance(values, array):
+            values.tofile(file)
+        else:
+            values = iter(values)
+            buffer = array("q", itertools.islice(values, buffer_items))
+            while buffer:
+                buffer.tofile(file)
+                buffer = array("q", itertools.islice(values, buffer_items))
+    return path
+
+# Read a run file back buffer_items values at a time.
+def _read_run(path, buffer_items):
+    with open(path, "rb") as file:
+        while True:
+            buffer = array("q")
+            try:
+                buffer.fromfile(file, buffer_items)
+            except EOFError:
+                # fromfile keeps the items it could read before the end.
+                pass
+            if not buffer:
+                return
+            yield from buffer
+
+'''
+Galloping search used by the adaptive merge and the set operations.
+Probes start, start + 1, start + 2, start + 4, start + 8, ... until it
+reaches an element that is not before value, then binary searches the
+last step, so finding a run of length r costs O(log r) comparisons
+whatever the length of the sequence.
+'''
+def _gallop(items, value, start, is_before, search):
+    length = len(items)
+    low = high = start
+    step = 1
+    while ( high < length and is_before(items[high], value) ):
+        low = high + 1
+        high = start + step
+        step *= 2
+    return search(items, value, low, min(high, length))
+
+# first index from start with items[index] >= value
+def _gallop_left(items, value, start):
+    return _gallop(items, value, start, operator.lt, bisect.bisect_left)
+
+# first index from start with items[index] > value
+def _gallop_right(items, value, start):
+    return _gallop(items, value, start, operator.le, bisect.bisect_right)
+
+def _use_numpy(arr1, arr2, out) -> bool:
+    return np is not None and any(isinstance(value, np.ndarray)
+                                  for value in (arr1, arr2, out))
+
+# Merge two sorted ndarrays by computing where each element goes.
+def _numpy_merge(arr1, arr2):
+    merged = np.empty(len(arr1) + len(arr2),
+                      dtype=np.result_type(arr1, arr2))
+    merged[np.arange(len(arr1)) + np.searchsorted(arr2, arr1, "left")] = arr1
+    merged[np.arange(len(arr2)) + np.searchsorted(arr1, arr2, "right")] = arr2
+    return merged
+
+# Mask of the elements of arr1 that have a partner in arr2: the i-th
+# copy of a value in arr1 is matched when arr2 has more than i copies.
+def _numpy_matched(arr1, arr2):
+    first_copy = np.searchsorted(arr1, arr1, "left")
+    copy_number = np.arange(len(arr1)) - first_copy
+    copies_in_arr2 = (np.searchsorted(arr2, arr1, "right")
+                      - np.searchsorted(arr2, arr1, "left"))
+    return copy_number < copies_in_arr2
+
+def _numpy_output(out, result):
+    if out is None:
+        return result
+    if ( len(result) > len(out) ):
+        raise ValueError("out is too small for the result")
+    out[:len(result)] = result
+    return len(result)
+
+'''
+Collects the output of the galloping methods, either into a new list
+(an array when both inputs are arrays of one typecode) or into the
+caller's out buffer, one slice assignment per run.
+'''
+class _SortedWriter:
+
+    def __init__(self, out, arr1, arr2):
+        self.fixed = out is not None
+        if self.fixed:
+            self.out = out
+        elif ( isinstance(arr1, array) and isinstance(arr2, array)
+               and arr1.typecode == arr2.typecode ):
+            self.out = array(arr1.typecode)
+        else:
+            self.out = []
+        self.count = 0
+
+    def extend(self, piece):
+        if isinstance(self.out, array) and not ( isinstance(piece, array)
+                and piece.typecode == self.out.typecode ):
+            piece = array(self.out.typecode, piece)
+        if not self.fixed:
+            self.out.extend(piece)
+            return
+        end = self.count + len(piece)
+        if ( end > len(self.out) ):
+            raise ValueError("out is too small for the result")
+        self.out[self.count:end] = piece
+        self.count = end
+
+    def append(self, value):
+        self.extend((value,))
+
+    def result(self):
+        return self.count if self.fixed else self.out
+
+# Kernels of the batch methods, see ragged_batch in Utility_Module.
+def _palindrome_kernel(values, offsets, first, last):
+    results = array("b")
+    for item in range(first, last):
+        part = values[offsets[item]:offsets[item + 1]]
+        results.append(part == part[::-1])
+    return results
+
+def _target_sum_kernel(values, offsets, first, last, target_sum):
+    results = array("b")
+    for item in range(first, last):
+        left_index = offsets[item]
+        right_index = offsets[item + 1] - 1
+        found = False
+        while ( left_index < right_index ):
+            curr_sum = values[left_index] + values[right_index]
+            if ( curr_sum == target_sum ):
+                found = True
+                break
+            if ( curr_sum < target_sum ):
+                left_index += 1
+            else:
+                right_index -= 1
+        results.append(found)
+    return results
+
+# Example inputs are arguments, so the demo runs without a terminal.
+def test_class_methods(input_str : str = "abba", target_sum : int = 10,
+                       source_str : str = "ab", target_str : str = "xaxb"):
     #initialize TwoPointers class
     two_pointer = TwoPointers("Hello")
 
     #Call method to check palindrome
-    input_str = input("please enter string to check if it's palindrome : ")
     flag = two_pointer.is_palindrome(input_str)
-    log.info(f"{input_str} is a palindrome : {flag}")
+    logger.info(f"{input_str} is a palindrome : {flag}")
+
+    #Test substring palindrome queries on a prebuilt index
+    document = "abacabadabacaba"
+    palindrome_index = two_pointer.build_palindrome_index(document)
+    start, end = palindrome_index.longest()
+    print(f"Longest palindrome in {document} : {document[start:end]}")
+    print(f"Is {document[1:4]} a palindrome : "
+          f"{palindrome_index.is_palindrome(1, 4)}")
 
     #Test target_sum method
     int_list = [1, 2, 4, 6, 8, 10, 12, 15, 19]
-    target_sum = int( input("Please enter target_sum : ") )
     #call method to check target sum acheived in list of integers
     result = two_pointer.check_for_target_sum(int_list, target_sum)
-    log.info(f"The target sum achieved : {result}")
+    logger.info(f"The target sum achieved : {result}")
+
+    #Test several target sums at once, the list doesn't need sorting.
+    target_sums = [3, 25, 100]
+    pairs = two_pointer.check_for_target_sums([12, 1, 15, 2], target_sums)
+    print(f"Index pairs for {target_sums} : {pairs}")
 
     #calling combine sorted array method
     list1 = [ 1, 5, 8, 18 ]
@@ -316,19 +1169,55 @@ def test_class_methods():
     sorted_list_arr = two_pointer.combine_sorted_array(list1, list2)
     print( f"Sorted list is : {sorted_list_arr}" )
 
+    #k-way merge of several sorted lists
+    list3 = [ 0, 3, 26 ]
+    merged = list(two_pointer.merge_sorted_iterables(list1, list2, list3))
+    print( f"Merged list is : {merged}" )
+
+    #Galloping merge of a small delta, and sorted set operations
+    delta = [ 6, 18, 40 ]
+    print( f"Adaptive merge is : "
+           f"{two_pointer.combine_sorted_array_adaptive(list2, delta)}" )
+    print( f"Intersection, union, difference : "
+           f"{two_pointer.sorted_intersection(list1, delta)}, "
+           f"{two_pointer.sorted_union(list1, delta)}, "
+           f"{two_pointer.sorted_difference(list1, delta)}" )
+
     #Test sub sequence method
-    source_str = input("Please enter source string : ")
-    target_str = input("Please enter target string : ")
     result = two_pointer.is_subsequence(source_str, target_str)
     print(f"Is {source_str} is a subsequence of  {target_str} : {result}")
 
+    #Test many source strings against one target at once
+    patterns = ["ace", "aec", "bd", ""]
+    results = two_pointer.is_subsequence_batch(patterns, "abcde")
+    print(f"Subsequences of abcde : {dict(zip(patterns, results))}")
+
     source_str_list = ["H", "a", "n", "n", "a", "h"]
     reversed_list = two_pointer.reverse_string(source_str_list)
     print(f" Reversed list is : {reversed_list}")
 
+    #Reverse a byte buffer in place, then every 4 byte block of it
+    payload = bytearray(b"abcdefgh")
+    two_pointer.reverse_buffer(payload)
+    print(f" Reversed buffer is : {payload}")
+    two_pointer.reverse_buffer(payload, block_size=4)
+    print(f" Reversed blocks are : {payload}")
+
     input_list = [-7, -3, 2, 3, 11]
     sorted_list = two_pointer.squares_of_sorted_array(input_list)
     print(f"Squared list is : {sorted_list}")
 
+    #Stream the squares instead of building the list
+    print(f"Streamed squares : "
+          f"{list(two_pointer.iter_squares_of_sorted_array(input_list))}")
+
+    #many small inputs in one call, as a flat buffer plus offsets
+    values, offsets = pack_ragged([b"abba", b"abc", b"x"], "B")
+    palindromes = two_pointer.is_palindrome_batch(bytes(values), offsets)
+    print(f"Palindromes : {palindromes.tolist()}")
+
 if __name__ == "__main__":
+    #set logging level at info. Only done when run as a script so
+    #importing the module doesn't configure logging for the caller.
+    log.basicConfig(level=log.INFO)
     test_class_methods()
\ No newline at end of file
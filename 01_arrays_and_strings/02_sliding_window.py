@@ -22,11 +22,31 @@ can be solved efficiently with sliding window.
     Another common task is finding the number of valid subarrays. 
 '''
 
+import bisect
+import contextlib
+import heapq
+import itertools
 import logging as log
-from Utility_Module import utility_decorator
+import math
+import mmap
+import numbers
+import operator
+import os
+import re
+from array import array
+from collections import Counter, deque, namedtuple
+from Utility_Module import (cacheable, utility_decorator, shared_buffers,
+                            attach_shared_buffer, lazy_import, pack_ragged,
+                            ragged_batch)
 
-#set logging level at debug
-log.basicConfig(level=log.INFO)
+# numpy is optional. When it is missing the vectorized paths fall back
+# to the plain python sliding window. It is only imported once a
+# vectorized path needs it, see lazy_import.
+np = lazy_import("numpy")
+
+# module logger, configured by the application (or the __main__ block
+# below); the module itself never calls basicConfig.
+logger = log.getLogger(__name__)
 
 class SlidingWindow:
 
@@ -34,8 +54,9 @@ class SlidingWindow:
     # work done in each loop iteration is amortized constant, 
     # so this algorithm has a runtime of O(n) and O(1) space complexity
     @utility_decorator
+    @cacheable
     def find_longest_subarray_length(self, nums : list[int], sum : int) -> int:
-        log.info(f"list is : {nums}")
+        logger.debug("list is : %s", nums)
 
         # if empty list is passed, raise error
         if (len(nums)== 0):
@@ -49,15 +70,15 @@ class SlidingWindow:
         # Check which sub-array has the longest length
         for right_index in range( len(nums) ):
             #curr_sum is added to whole elements.
-            log.debug(f"value is : {nums[right_index]}")
-            log.debug(f"right index is : {right_index}")
+            logger.debug("value is : %s", nums[right_index])
+            logger.debug("right index is : %s", right_index)
             curr_sum += nums[right_index]
 
             # Check if curr_sum has exceeded sum
             # Then shrink the sliding window by removing elements 
             # from left.
             while (curr_sum > sum):
-                log.debug(f"curr_sum in while loop : {curr_sum}")
+                logger.debug("curr_sum in while loop : %s", curr_sum)
 
                 #remove the left element from sliding window 
                 curr_sum -= nums[left_index]
@@ -65,8 +86,8 @@ class SlidingWindow:
                 left_index += 1
 
                 if (left_index <= right_index):
-                    log.debug(f"value is : {nums[left_index]}")
-                    log.debug(f"left index is : {left_index}")
+                    logger.debug("value is : %s", nums[left_index])
+                    logger.debug("left index is : %s", left_index)
 
             
             long_window_length = max( long_window_length,
@@ -79,12 +100,13 @@ class SlidingWindow:
     # work done in each loop iteration is amortized constant, 
     # so this algorithm has a runtime of O(n) and O(1) space complexity
     @utility_decorator    
+    @cacheable
     def flip_zeroes_subarray_length(self, binary_string : str) -> int:
         #check if array is not empty
         if ( len(binary_string) == 0 ):
             raise ValueError("List can't be empty")
         
-        log.info(f"List is : {binary_string}")
+        logger.debug("List is : %s", binary_string)
         # initialize the variables
         zeroes_count = left_index = window_length = 0
 
@@ -100,11 +122,11 @@ class SlidingWindow:
             # iterate from left to find the zero position
             # reset the counter to reset sliding window.
             while ( zeroes_count > 1 ):
-                log.debug(f"counter increased to {zeroes_count}")
-                log.debug(f"left index is : {left_index}")
+                logger.debug("counter increased to %s", zeroes_count)
+                logger.debug("left index is : %s", left_index)
                 # check if we have moved to zero occurence, then reset
                 if binary_string[left_index] == "0":
-                    log.debug(f"Found preceeding zero position : {left_index}")
+                    logger.debug("Found preceeding zero position : %s", left_index)
                     zeroes_count -= 1
                 #iterate left_index
                 left_index += 1
@@ -112,18 +134,58 @@ class SlidingWindow:
              # Compare the subarray sliding window length
              # and store in long_window_length
              # memorize sliding window length as (right-left+1)
-            log.debug(f"zeroes_count is : {zeroes_count}")
+            logger.debug("zeroes_count is : %s", zeroes_count)
             window_length = max( window_length, 
                                      right_index - left_index + 1)
 
         return window_length
+
+    '''
+    Build a PrefixSumIndex to answer find_longest_subarray_length for
+    many sum limits and sub-ranges of nums, see PrefixSumIndex.
+    '''
+    def build_prefix_sum_index(self, nums : list[int]):
+        return PrefixSumIndex(nums)
+
+    '''
+    flip_zeroes_subarray_length for long bitmaps, generalized to flipping
+    at most k zeroes.
+        * binary_string is a str or bytes of "0" / "1" characters, or,
+          when packed_length is given, a packed bitset of that many bits
+          (bytes, most significant bit first like numpy.packbits).
+        * Zero positions come from str.find / bytes.find, which jump to
+          the next zero in C. For bitsets, bytes that are all ones are
+          skipped by a regex scan and only the other bytes are looked at.
+        * The answer is computed from the zero positions alone with
+          LongestOnesIndex, so the python work grows with the number of
+          zeroes, not the number of characters.
+    '''
+    @utility_decorator
+    @cacheable
+    def flip_zeroes_subarray_length_fast(self, binary_string, k : int = 1,
+                                         packed_length : int = None) -> int:
+        if packed_length is not None:
+            if not ( 0 < packed_length <= 8 * len(binary_string) ):
+                raise ValueError("packed_length doesn't fit the bitset")
+            zero_positions = _packed_zero_positions(binary_string,
+                                                    packed_length)
+            length = packed_length
+        else:
+            if ( len(binary_string) == 0 ):
+                raise ValueError("List can't be empty")
+            zero_positions = _char_zero_positions(binary_string)
+            length = len(binary_string)
+
+        return LongestOnesIndex.from_zero_positions(
+                    zero_positions, length).query(k)[0]
     
     #Given an array of positive integers nums and an integer k, 
     # return the number of subarrays where the product of all the 
     # elements in the subarray is strictly less than k.
     # work done in each loop iteration is amortized constant, 
     # so this algorithm has a runtime of O(n) and O(1) space complexity
- 
+    @utility_decorator
+    @cacheable
     def find_subarrays_that_match(self, nums : list[int], 
                                   match_val : int) -> int:
         # if match_val is <= 1, then no subarrays can exist.
@@ -144,7 +206,7 @@ class SlidingWindow:
         for right_index in range(len(nums)):
             # multiply elements of list
             curr_sum *= nums[right_index]
-            log.debug(f"curr_sum is : {curr_sum} ")
+            logger.debug("curr_sum is : %s ", curr_sum)
             # check if cur_sum exceeds match value
             while (curr_sum >= match_val):
                 curr_sum //= nums[left_index]
@@ -155,16 +217,66 @@ class SlidingWindow:
         
         return no_of_valid_sub_arrays
 
+    '''
+    find_subarrays_that_match for a whole ladder of thresholds.
+        * Returns the number of subarrays with product < threshold for
+          every threshold, in the order given.
+        * Zeros are allowed: a subarray containing a zero has product 0,
+          so it counts for every positive threshold. The list is split
+          into zero free segments and the sliding window only runs inside
+          them. Negative values are rejected.
+        * The exact mode makes one pass over each segment, moving one
+          window (left pointer and product) per threshold.
+        * log_space=True works on prefix sums of logs instead, so no
+          huge products are built. A window is valid when
+          prefix[r] - prefix[l] < log(threshold), and since the prefix
+          sums never decrease the valid left ends are found by binary
+          search (vectorized with numpy). Left ends whose log sum is
+          within rounding distance of log(threshold) are checked with an
+          exact product, so the counts match the exact mode.
+    '''
+    @utility_decorator
+    @cacheable
+    def count_subarrays_below_thresholds(self, nums : list[int],
+                                         thresholds : list[int],
+                                         log_space : bool = False) -> list[int]:
+        if (len(nums) == 0):
+            raise ValueError("List cant be empty")
+        segments = _zero_free_segments(nums)
+
+        #subarrays that contain at least one zero
+        total = len(nums) * (len(nums) + 1) // 2
+        with_zero = total - sum(len(segment) * (len(segment) + 1) // 2
+                                for segment in segments)
+
+        counts = [with_zero if threshold > 0 else 0
+                  for threshold in thresholds]
+        for segment in segments:
+            if log_space:
+                segment_counts = _count_below_log_space(segment, thresholds)
+            else:
+                segment_counts = _count_below_exact(segment, thresholds)
+            counts = list(map(operator.add, counts, segment_counts))
+        return counts
+
     # Given an integer array nums and an integer k, find the sum of 
     # the subarray with the largest sum whose length is k
     # The total for loop iterations is equal to n, where n is length
     # of nums. So this algorithm has a runtime of O(n) and O(1) space complexity
+    # Pass vectorized=True to compute all window sums in one go through
+    # fixed_window_series (numpy when available).
+    @utility_decorator
+    @cacheable
     def find_max_sum_in_fixed_sub_array(self , nums : list[int], 
-                                        array_fixed_length : int) -> int:
-        log.debug(f"List is : {nums}")
+                                        array_fixed_length : int,
+                                        vectorized : bool = False) -> int:
+        logger.debug("List is : %s", nums)
         if (len(nums) == 0):
             raise ValueError("List cant be empty")
 
+        if vectorized:
+            return self.fixed_window_series(nums, array_fixed_length)[2]
+
         #initialize the variables.
         curr_sum = max_sum = 0
         # move to fixed length first.
@@ -175,9 +287,9 @@ class SlidingWindow:
         # iterate through the next range by sliding through window
         # length
         for i in range(array_fixed_length, len(nums)):
-            log.debug(f" start index after initial move is : {i}")
-            log.debug(f"remove index is : {i - array_fixed_length}")
-            curr_sum = nums[i] - nums[i - array_fixed_length]
+            logger.debug(" start index after initial move is : %s", i)
+            logger.debug("remove index is : %s", i - array_fixed_length)
+            curr_sum += nums[i] - nums[i - array_fixed_length]
 
             #check the maximum value against each iter
             max_sum = max( max_sum, curr_sum)
@@ -186,8 +298,14 @@ class SlidingWindow:
     # Find a contiguous subarray whose length is equal to k that has 
     # the maximum average value and return this value.
     @utility_decorator
+    @cacheable
     def find_max_average(self, nums: list[int],
-                          fixed_array_length : int) -> float:
+                          fixed_array_length : int,
+                          vectorized : bool = False) -> float:
+        if vectorized:
+            return self.fixed_window_series(nums, fixed_array_length,
+                                            average=True)[2]
+
         # Initialize the variables.
         max_average = curr_sum = 0
         
@@ -195,10 +313,10 @@ class SlidingWindow:
         for i in range(fixed_array_length):
             curr_sum += nums[i]   
         
-        log.debug(f"curr_sum in first window is : {curr_sum}")
+        logger.debug("curr_sum in first window is : %s", curr_sum)
         #calculate the average for fixed length target window
         max_average = curr_sum / fixed_array_length
-        log.debug(f"average after first iteration is : {max_average}")
+        logger.debug("average after first iteration is : %s", max_average)
         
         # Iterate through next sliding window by 
         # decrementing the left most value and adding the next one.
@@ -206,21 +324,256 @@ class SlidingWindow:
             # Add the next element and remove the previous first
             # element to sliding window
             curr_sum += ( nums[j] - nums[j - fixed_array_length] )
-            log.debug(f"curr_sum in {j}, {j - fixed_array_length} window is : {curr_sum}")
-            log.debug(f"average is : {max_average}")
+            logger.debug("curr_sum in %s, %s window is : %s", j, j - fixed_array_length, curr_sum)
+            logger.debug("average is : %s", max_average)
             # check the maximum average by using max function.
             max_average = max(max_average, (curr_sum / fixed_array_length))
          
         return max_average
     
+    '''
+    Compute every fixed length window sum (or average) and return the
+    whole series along with the position and value of the best window.
+        * With numpy the input (ndarray or list, converted once) goes
+          through a single cumulative sum and each window sum is
+          prefix[i + k] - prefix[i]. That is O(n) but done in C.
+        * Float inputs are summed in float64 whatever their dtype.
+        * Without numpy, for inputs numpy can only hold as objects (ints
+          wider than int64), or when a window sum could pass the int64
+          range, it falls back to the exact python sliding window.
+        * Returns (series, best_index, best_value). series is an ndarray
+          on the numpy path and a list otherwise. best_index is the
+          start of the first window with the maximum value.
+    '''
+    @utility_decorator
+    @cacheable
+    def fixed_window_series(self, nums : list[int],
+                            array_fixed_length : int,
+                            average : bool = False) -> tuple:
+        nums_length = len(nums)
+        if ( nums_length == 0 ):
+            raise ValueError("List cant be empty")
+        if not ( 0 < array_fixed_length <= nums_length ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+
+        if np is not None:
+            arr = np.asarray(nums)
+            if arr.dtype.kind in "biu":
+                largest = max(abs(int(arr.min())), abs(int(arr.max())))
+                if ( largest * array_fixed_length >= 1 << 63 ):
+                    # window sums could wrap in int64, sum them as
+                    # python ints instead so the answer stays exact
+                    nums = arr.tolist()
+                    arr = None
+                else:
+                    arr = arr.astype(np.int64, copy=False)
+            elif arr.dtype.kind == "f":
+                # low precision floats lose the small window sums in a
+                # long running total, so always accumulate in float64
+                arr = arr.astype(np.float64, copy=False)
+            else:
+                arr = None
+            if arr is not None:
+                # prefix[0] stays 0 so prefix[k:] - prefix[:-k] covers
+                # the first window as well.
+                prefix = np.zeros(nums_length + 1, dtype=arr.dtype)
+                np.cumsum(arr, out=prefix[1:])
+                series = (prefix[array_fixed_length:]
+                          - prefix[:-array_fixed_length])
+                if average:
+                    series = series / array_fixed_length
+                best_index = int(np.argmax(series))
+                return series, best_index, series[best_index].item()
+
+        # plain python sliding window.
+        curr_sum = 0
+        for i in range(array_fixed_length):
+            curr_sum += nums[i]
+        series = [curr_sum]
+        for i in range(array_fixed_length, nums_length):
+            curr_sum += nums[i] - nums[i - array_fixed_length]
+            series.append(curr_sum)
+
+        if average:
+            series = [value / array_fixed_length for value in series]
+        best_index = max(range(len(series)), key=series.__getitem__)
+        return series, best_index, series[best_index]
+
+    '''
+    The k best fixed length windows instead of only the maximum.
+        * Returns [(value, start), ...] best first, earlier windows first
+          on ties. value is the window sum, or its average with
+          average=True.
+        * The default path is one streaming pass over nums (any iterable)
+          that keeps the last array_fixed_length values and a min-heap of
+          the k best windows so far, so memory is O(k + window length).
+        * vectorized=True takes the window series from
+          fixed_window_series and picks the k best with
+          numpy.argpartition, O(n) for large in-memory arrays.
+        * non_overlapping=True picks windows greedily, best first,
+          skipping any window that overlaps one already picked. That
+          needs every window sum, so it uses the series and O(n) memory.
+    '''
+    @utility_decorator
+    @cacheable
+    def find_top_k_windows(self, nums, array_fixed_length : int, k : int,
+                           non_overlapping : bool = False,
+                           average : bool = False,
+                           vectorized : bool = False) -> list[tuple]:
+        if ( k < 0 ):
+            raise ValueError("k can't be negative")
+        if ( array_fixed_length <= 0 ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+
+        if vectorized or non_overlapping:
+            series = self.fixed_window_series(nums, array_fixed_length,
+                                              average)[0]
+            if non_overlapping:
+                return _pick_non_overlapping(series, array_fixed_length, k)
+            if np is not None and isinstance(series, np.ndarray):
+                return _top_k_vectorized(series, k)
+            nums = series
+            array_fixed_length = 1
+            average = False
+
+        window = deque(maxlen=array_fixed_length)
+        curr_sum = 0
+        start = 0
+        # min-heap of (sum, -start), the worst kept window on top
+        best_windows = []
+        for value in nums:
+            if ( len(window) == array_fixed_length ):
+                curr_sum -= window[0]
+            window.append(value)
+            curr_sum += value
+            if ( len(window) < array_fixed_length ):
+                continue
+            candidate = (curr_sum, -start)
+            if ( len(best_windows) < k ):
+                heapq.heappush(best_windows, candidate)
+            elif ( k and candidate > best_windows[0] ):
+                heapq.heapreplace(best_windows, candidate)
+            start += 1
+
+        if ( len(window) < array_fixed_length ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+        best_windows.sort(reverse=True)
+        if average:
+            return [(window_sum / array_fixed_length, -negative_start)
+                    for window_sum, negative_start in best_windows]
+        return [(window_sum, -negative_start)
+                for window_sum, negative_start in best_windows]
+
+    '''
+    Aggregate of every fixed length window, for any aggregate the
+    AggregateWindow engine supports (a preset name such as "max", "min",
+    "gcd", "or", "distinct", or an Aggregate). O(1) amortized per step
+    even for aggregates that can't be undone by subtraction.
+    '''
+    @utility_decorator
+    def fixed_window_aggregates(self, nums : list[int],
+                                array_fixed_length : int,
+                                aggregate = "sum") -> list:
+        if not ( 0 < array_fixed_length <= len(nums) ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+        window = AggregateWindow(aggregate)
+        results = []
+        for i, value in enumerate(nums):
+            window.push(value)
+            if ( i >= array_fixed_length ):
+                window.pop()
+            if ( i >= array_fixed_length - 1 ):
+                results.append(window.query())
+        return results
+
+    '''
+    Longest window whose aggregate satisfies predicate, as
+    (length, start, end) with end exclusive.
+        * predicate must be monotone: if a window is valid every window
+          inside it is valid too (sum <= S over non-negative values,
+          max <= limit, distinct count <= k, ...). Then the usual
+          variable size window applies: grow on the right, and pop from
+          the left while the aggregate fails the predicate.
+    '''
+    @utility_decorator
+    def find_longest_window_where(self, nums : list[int], predicate,
+                                  aggregate = "sum") -> tuple[int, int, int]:
+        window = AggregateWindow(aggregate)
+        left_index = best_length = best_start = 0
+        for right_index, value in enumerate(nums):
+            window.push(value)
+            while ( len(window) and not predicate(window.query()) ):
+                window.pop()
+                left_index += 1
+            if ( right_index - left_index + 1 > best_length ):
+                best_length = right_index - left_index + 1
+                best_start = left_index
+        return best_length, best_start, best_start + best_length
+
+    '''
+    Rolling maximum / minimum of every fixed length window.
+        * A monotonic deque holds the indexes and values that can
+          still become the window maximum (minimum), with the best one
+          in front. Each index enters and leaves once, so the whole
+          series is O(n). ndarrays are read in bounded chunks, so the
+          extra memory is O(k) besides the output.
+        * Results go into out when given (anything with item assignment
+          and n - k + 1 slots), otherwise into a preallocated numpy
+          array, or array('q') / array('d') without numpy.
+    '''
+    @utility_decorator
+    def rolling_max(self, nums : list[int], array_fixed_length : int,
+                    out = None):
+        return _rolling_extreme(nums, array_fixed_length, out,
+                                operator.le)
+
+    @utility_decorator
+    def rolling_min(self, nums : list[int], array_fixed_length : int,
+                    out = None):
+        return _rolling_extreme(nums, array_fixed_length, out,
+                                operator.ge)
+
+    '''
+    Rolling median of every fixed length window.
+        * The window is split over two heaps: a max heap with the lower
+          half and a min heap with the upper half, kept balanced so the
+          median sits on top. Values leaving the window are deleted
+          lazily, only once they reach the top of a heap. That is
+          O(log k) amortized per step, O(n log k) overall.
+        * For even window lengths the median is the mean of the two
+          middle values. Output is float, written into out or a
+          preallocated float buffer like rolling_max.
+    '''
+    @utility_decorator
+    def rolling_median(self, nums : list[int], array_fixed_length : int,
+                       out = None):
+        values = _window_values(nums, array_fixed_length)
+        out = _window_output(nums, array_fixed_length, out, True)
+        median = _RollingMedian()
+        #the values in the window, oldest first
+        window = deque()
+        for i, value in enumerate(values):
+            median.add(value)
+            window.append(value)
+            if ( i >= array_fixed_length ):
+                median.remove(window.popleft())
+            if ( i >= array_fixed_length - 1 ):
+                out[i - array_fixed_length + 1] = median.median()
+        return out
+
     #Find the longest ones in input string.
     @utility_decorator
+    @cacheable
     def find_longest_ones_in_list(self, nums: list[int], k: int) -> int:
         
         if ( len(nums) == 0 ):
             raise ValueError("List can't be empty")
         
-        log.info(f"List is : {nums} ")
+        logger.debug("List is : %s ", nums)
 
         # initialize the variable
         zeroes_count = left_index  = window_length = 0
@@ -247,6 +600,1378 @@ class SlidingWindow:
                 
         return window_length
 
+    # Answer find_longest_ones_in_list for many k values over the same
+    # list. The zero positions are indexed once and each k is answered
+    # from the index, see LongestOnesIndex.
+    @utility_decorator
+    @cacheable
+    def find_longest_ones_for_many_k(self, nums : list[int],
+                                     k_values : list[int]) -> list[int]:
+        ones_index = LongestOnesIndex(nums)
+        return [length for length, _, _ in ones_index.query_many(k_values)]
+
+    '''
+    Batch versions for many small inputs. values is one flat buffer of
+    every input back to back and offsets has one more entry than there
+    are inputs: input i is values[offsets[i]:offsets[i+1]] (see
+    Utility_Module.pack_ragged). The inputs are checked once, run in a
+    tight loop with no per input logging, optionally spread over
+    processes through shared memory, and the results come back as an
+    array('q') with one entry per input.
+    '''
+    @utility_decorator
+    @cacheable
+    def find_max_sum_batch(self, values, offsets, array_fixed_length : int,
+                           processes : int = 1) -> array:
+        if ( array_fixed_length <= 0 or
+             any(stop - start < array_fixed_length
+                 for start, stop in zip(offsets, offsets[1:])) ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+        return ragged_batch(_max_sum_kernel, values, offsets,
+                            (array_fixed_length,), processes=processes)
+
+    @utility_decorator
+    @cacheable
+    def find_longest_ones_batch(self, values, offsets, k : int,
+                                processes : int = 1) -> array:
+        if ( k < 0 ):
+            raise ValueError("k can't be negative")
+        return ragged_batch(_longest_ones_kernel, values, offsets, (k,),
+                            processes=processes)
+
+'''
+Streaming version of find_longest_subarray_length.
+    * Values are pushed one at a time (or from any iterable, including
+      generators that never end), so the input never has to sit in a
+      list.
+    * Only the current window is kept in a deque, so memory depends on
+      the window size and not on the stream length.
+    * At any time longest_length, best_start and best_end give the
+      longest window seen so far. Offsets are stream positions and
+      best_end is exclusive, like a python slice.
+'''
+class StreamingLongestSubarray:
+
+    #Constructor method
+    def __init__(self, sum : int):
+        self.sum = sum
+        self.window = deque()
+        self.curr_sum = 0
+        # stream offset of the next value to be pushed
+        self.offset = 0
+        self.longest_length = self.best_start = self.best_end = 0
+
+    # Add one value at the right end of the window and shrink it from
+    # the left while the window sum exceeds the limit.
+    def push(self, value : int) -> int:
+        self.window.append(value)
+        self.curr_sum += value
+        self.offset += 1
+
+        while ( self.curr_sum > self.sum and self.window ):
+            self.curr_sum -= self.window.popleft()
+
+        window_length = len(self.window)
+        if ( window_length > self.longest_length ):
+            self.longest_length = window_length
+            self.best_start = self.offset - window_length
+            self.best_end = self.offset
+
+        return self.longest_length
+
+    # Push every value of an iterable and return the longest length.
+    def push_many(self, values) -> int:
+        for value in values:
+            self.push(value)
+        return self.longest_length
+
+    # Longest window seen so far as (length, start, end).
+    def result(self) -> tuple[int, int, int]:
+        return self.longest_length, self.best_start, self.best_end
+
+'''
+Streaming version of find_longest_ones_in_list. Only the stream offsets
+of the zeroes inside the window are kept (at most k of them), so
+memory depends on k and not on the window or stream length.
+'''
+class StreamingLongestOnes:
+
+    #Constructor method
+    def __init__(self, k : int):
+        if ( k < 0 ):
+            raise ValueError("k can't be negative")
+        self.k = k
+        self.window_zeros = deque()
+        self.left_index = 0
+        self.offset = 0
+        self.longest_length = self.best_start = self.best_end = 0
+
+    def push(self, value : int) -> int:
+        if ( value == 0 ):
+            self.window_zeros.append(self.offset)
+            #one zero too many, the window now starts right after the
+            #oldest zero.
+            if ( len(self.window_zeros) > self.k ):
+                self.left_index = self.window_zeros.popleft() + 1
+        self.offset += 1
+
+        window_length = self.offset - self.left_index
+        if ( window_length > self.longest_length ):
+            self.longest_length = window_length
+            self.best_start = self.left_index
+            self.best_end = self.offset
+
+        return self.longest_length
+
+    def push_many(self, values) -> int:
+        for value in values:
+            self.push(value)
+        return self.longest_length
+
+    def result(self) -> tuple[int, int, int]:
+        return self.longest_length, self.best_start, self.best_end
+
+'''
+Streaming version of find_max_sum_in_fixed_sub_array. The last k values
+are kept in a deque to slide the window sum; the best sum seen so far
+and the stream offset of its window are reported.
+'''
+class StreamingMaxWindowSum:
+
+    #Constructor method
+    def __init__(self, array_fixed_length : int):
+        if ( array_fixed_length <= 0 ):
+            raise ValueError("Window length must be positive")
+        self.array_fixed_length = array_fixed_length
+        self.window = deque()
+        self.curr_sum = 0
+        self.offset = 0
+        self.max_sum = self.best_start = None
+
+    # Returns the best window sum so far, None until the first window
+    # is full.
+    def push(self, value : int):
+        self.window.append(value)
+        self.curr_sum += value
+        self.offset += 1
+        if ( len(self.window) > self.array_fixed_length ):
+            self.curr_sum -= self.window.popleft()
+
+        if ( len(self.window) == self.array_fixed_length
+             and ( self.max_sum is None or self.curr_sum > self.max_sum ) ):
+            self.max_sum = self.curr_sum
+            self.best_start = self.offset - self.array_fixed_length
+
+        return self.max_sum
+
+    def push_many(self, values):
+        for value in values:
+            self.push(value)
+        return self.max_sum
+
+    def result(self) -> tuple:
+        return self.max_sum, self.best_start
+
+'''
+Index over the zero positions of a binary array.
+    * The longest run of ones with at most k zeroes flipped always spans
+      from just after one zero to just before the zero k + 1 positions
+      later. With the zero positions stored once (plus a -1 and n
+      sentinel on both ends) a query is a single pass over the zero
+      positions: max(zeros[i + k + 1] - zeros[i] - 1).
+    * So the input is scanned once when the index is built, and each k
+      costs O(number of zeroes), done with map / numpy instead of a
+      python loop.
+    * list[int], bytes / bytearray / memoryview (byte values 0 and 1) and
+      numpy arrays are accepted. bytes are searched with bytes.find so
+      the build jumps from zero to zero in C.
+    * Queries return (length, start, end) with end exclusive.
+'''
+class LongestOnesIndex:
+
+    #Constructor method
+    def __init__(self, nums):
+        if ( len(nums) == 0 ):
+            raise ValueError("List can't be empty")
+        self._set_zero_positions(_zero_positions(nums), len(nums))
+
+    # Build the index straight from known zero positions.
+    @classmethod
+    def from_zero_positions(cls, zero_positions, length : int):
+        ones_index = cls.__new__(cls)
+        ones_index._set_zero_positions(list(zero_positions), length)
+        return ones_index
+
+    def _set_zero_positions(self, zero_positions, length):
+        self.length = length
+        self.zero_count = len(zero_positions)
+        bounded = [-1]
+        bounded.extend(zero_positions)
+        bounded.append(length)
+        if np is not None:
+            self.bounded_zeros = np.asarray(bounded, dtype=np.int64)
+        else:
+            self.bounded_zeros = bounded
+
+    def query(self, k : int) -> tuple[int, int, int]:
+        if ( k < 0 ):
+            raise ValueError("k can't be negative")
+        # every zero can be flipped, so the whole array is the window.
+        if ( k >= self.zero_count ):
+            return self.length, 0, self.length
+
+        zeros = self.bounded_zeros
+        if np is not None:
+            gaps = zeros[k + 1:] - zeros[:-(k + 1)]
+            best = int(np.argmax(gaps))
+            best_gap = int(gaps[best])
+        else:
+            gaps = list(map(operator.sub, zeros[k + 1:], zeros))
+            best_gap = max(gaps)
+            best = gaps.index(best_gap)
+
+        start = int(zeros[best]) + 1
+        return best_gap - 1, start, start + best_gap - 1
+
+    def query_many(self, k_values) -> list[tuple[int, int, int]]:
+        return [self.query(int(k)) for k in k_values]
+
+# Positions of the zeroes in a binary list, bytes-like object or ndarray.
+def _zero_positions(nums) -> list[int]:
+    if np is not None and isinstance(nums, np.ndarray):
+        return np.flatnonzero(nums == 0).tolist()
+
+    if isinstance(nums, (bytes, bytearray, memoryview)):
+        data = bytes(nums) if isinstance(nums, memoryview) else nums
+        positions = []
+        position = data.find(0)
+        while ( position != -1 ):
+            positions.append(position)
+            position = data.find(0, position + 1)
+        return positions
+
+    return [i for i, value in enumerate(nums) if value == 0]
+
+'''
+Prebuilt index for find_longest_subarray_length over many sum limits
+and sub-ranges of one array.
+    * The prefix sums are stored once, as an array('q') viewed by numpy
+      when it is available (a plain list of exact ints when they could
+      come near the int64 range).
+      Float inputs keep float64 prefix sums, so their answers are
+      subject to the usual float rounding.
+    * A window nums[l:r] has sum <= S when prefix[l] >= prefix[r] - S,
+      so for every right end the best left end is the first prefix at
+      or above prefix[r] - S. With non-negative values the prefix sums
+      are sorted and that is a binary search. With negative values the
+      search runs over the running maximum of the prefix sums instead,
+      whose first entry at or above a value is the same position.
+      Without numpy, non-negative inputs use the O(m) two pointer scan
+      over the prefix sums instead of a binary search per right end.
+    * query(S, start, stop) is O(m log m) for a range of length m, done
+      as one numpy searchsorted when numpy is available. query_many
+      answers a list of S or (S, start, stop) queries, vectorized over
+      all the limits that share a range.
+    * Results are (length, start, end) with end exclusive; a length of
+      0 means no window in the range fits the limit.
+'''
+# bound on prefix sums kept in int64, leaving room for prefix - limit
+_PREFIX_SUM_BOUND = 1 << 62
+
+class PrefixSumIndex:
+
+    # queries * range length searched per numpy call in query_many
+    BLOCK_ITEMS = 1 << 22
+
+    #Constructor method
+    def __init__(self, nums):
+        if ( len(nums) == 0 ):
+            raise ValueError("List can't be empty")
+        self.length = len(nums)
+        if np is not None and isinstance(nums, np.ndarray):
+            kind = nums.dtype.kind
+            # int64 prefix sums (and prefix - limit) can't wrap while
+            # every value times the length stays below 2**62
+            if kind == "f" or ( kind in "biu" and
+                    max(abs(int(nums.min())), abs(int(nums.max())))
+                    * len(nums) < _PREFIX_SUM_BOUND ):
+                self.non_negative = bool((nums >= 0).all())
+                dtype = np.float64 if kind == "f" else np.int64
+                self.prefix = np.concatenate(([0], np.cumsum(nums,
+                                                             dtype=dtype)))
+                return
+            # large ints or object arrays are summed as python numbers
+            nums = nums.tolist()
+
+        prefix = [0]
+        prefix.extend(itertools.accumulate(nums))
+        self.non_negative = all(value >= 0 for value in nums)
+        if not all(isinstance(value, int) for value in prefix):
+            if not all(isinstance(value, (int, float)) for value in prefix):
+                raise ValueError("PrefixSumIndex needs int or float values")
+            # float sums are kept as float64
+            self.prefix = array("d", prefix)
+        elif ( max(map(abs, prefix)) >= _PREFIX_SUM_BOUND ):
+            # exact python ints, searched without numpy
+            self.prefix = prefix
+            return
+        else:
+            self.prefix = array("q", prefix)
+        if np is not None:
+            dtype = np.float64 if self.prefix.typecode == "d" else np.int64
+            self.prefix = np.frombuffer(self.prefix, dtype=dtype)
+
+    def _bounds(self, start, stop):
+        stop = self.length if stop is None else stop
+        if not ( 0 <= start <= stop <= self.length ):
+            raise IndexError("query range out of bounds")
+        return start, stop
+
+    # prefix sums of the range and the sorted sequence searched over them
+    def _searched(self, start, stop):
+        prefix = self.prefix[start:stop + 1]
+        if self.non_negative:
+            return prefix, prefix
+        if np is not None and isinstance(prefix, np.ndarray):
+            return prefix, np.maximum.accumulate(prefix)
+        return prefix, list(itertools.accumulate(prefix, max))
+
+    def query(self, sum : int, start : int = 0,
+              stop : int = None) -> tuple[int, int, int]:
+        return self.query_many([(sum, start, stop)])[0]
+
+    def query_many(self, queries) -> list[tuple[int, int, int]]:
+        results = [None] * len(queries)
+        by_range = {}
+        for position, query in enumerate(queries):
+            if isinstance(query, tuple):
+                limit, start, stop = query + (None,) * (3 - len(query))
+            else:
+                limit, start, stop = query, None, None
+            by_range.setdefault(self._bounds(start or 0, stop),
+                                []).append((position, limit))
+
+        for (start, stop), limits in by_range.items():
+            if ( start == stop ):
+                for position, _ in limits:
+                    results[position] = (0, start, start)
+                continue
+            prefix, searched = self._searched(start, stop)
+            if np is not None and isinstance(prefix, np.ndarray):
+                answers = self._query_vectorized(prefix, searched,
+                                                 [limit for _, limit in limits])
+            else:
+                int_sums = getattr(prefix, "typecode", "q") != "d"
+                answers = [_longest_below(prefix, searched,
+                                          _int_limit(limit) if int_sums
+                                          else limit)
+                           for _, limit in limits]
+            for (position, _), (length, left) in zip(limits, answers):
+                results[position] = (length, start + left,
+                                     start + left + length)
+        return results
+
+    def _query_vectorized(self, prefix, searched, limits):
+        window_count = len(prefix) - 1
+        ends = np.arange(1, window_count + 1)
+        answers = []
+        block = max(1, self.BLOCK_ITEMS // window_count)
+        for first in range(0, len(limits), block):
+            chunk = limits[first:first + block]
+            if ( prefix.dtype.kind == "f" ):
+                targets = prefix[1:] - np.asarray(chunk,
+                                                  dtype=np.float64)[:, None]
+                answers.extend(_longest_from_targets(searched, targets, ends))
+                continue
+            chunk = [_int_limit(limit) for limit in chunk]
+            # limits past int64 would overflow prefix - limit
+            if any(abs(limit) >= 1 << 62 for limit in chunk):
+                exact_prefix = prefix.tolist()
+                exact_searched = (exact_prefix if searched is prefix
+                                  else searched.tolist())
+                answers.extend(_longest_below(exact_prefix, exact_searched,
+                                              limit)
+                               for limit in chunk)
+                continue
+            targets = prefix[1:] - np.asarray(chunk, dtype=np.int64)[:, None]
+            answers.extend(_longest_from_targets(searched, targets, ends))
+        return answers
+
+# Sums are ints, so a fractional limit acts like its floor; flooring also
+# keeps prefix - limit exact for large int prefix sums.
+def _int_limit(limit):
+    return math.floor(limit) if math.isfinite(limit) else limit
+
+# (length, left) of the longest window for every row of targets, where
+# targets[q, r] is prefix[r + 1] - limit of query q.
+def _longest_from_targets(searched, targets, ends) -> list[tuple[int, int]]:
+    lefts = np.searchsorted(searched, targets.ravel(),
+                            side="left").reshape(targets.shape)
+    lengths = np.where(lefts < ends, ends - lefts, 0)
+    best = np.argmax(lengths, axis=1)
+    answers = []
+    for row, right in enumerate(best.tolist()):
+        length = int(lengths[row, right])
+        answers.append((length, right + 1 - length if length else 0))
+    return answers
+
+# Longest window of a range with sum <= limit, as (length, left), from
+# its prefix sums and their sorted (running maximum) version.
+def _longest_below(prefix, searched, limit) -> tuple[int, int]:
+    # sorted prefix sums (non-negative values): the valid left end only
+    # moves right, so the O(m) two pointer scan beats O(m log m) bisects
+    if searched is prefix:
+        return _longest_below_two_pointer(prefix, limit)
+    best_length = best_left = 0
+    for right in range(1, len(prefix)):
+        left = bisect.bisect_left(searched, prefix[right] - limit, 0, right)
+        if ( right - left > best_length ):
+            best_length = right - left
+            best_left = left
+    return best_length, best_left
+
+def _longest_below_two_pointer(prefix, limit) -> tuple[int, int]:
+    best_length = best_left = left = 0
+    for right in range(1, len(prefix)):
+        while ( left < right and prefix[right] - prefix[left] > limit ):
+            left += 1
+        if ( right - left > best_length ):
+            best_length = right - left
+            best_left = left
+    return best_length, best_left
+
+'''
+find_max_sum_in_fixed_sub_array / find_max_average over a list that
+keeps changing.
+    * A segment tree holds the sum of every window of
+      array_fixed_length values, with the maximum of each subtree at its
+      node. Changing one value changes the sum of up to
+      array_fixed_length neighbouring windows, which is one lazy range
+      add, so update(index, value) is O(log n).
+    * append adds one window whose sum comes from the previous one, and
+      pop_left empties the leaf of the first window; both are O(log n).
+      The tree is rebuilt in O(n) when it runs out of leaves or when
+      half of it has been popped, so that stays amortized.
+    * best() gives (max_sum, start, end) of the best window right now,
+      the leftmost one on ties, and best_average() its average.
+'''
+class DynamicFixedWindowMax:
+
+    #Constructor method
+    def __init__(self, nums, array_fixed_length : int):
+        if ( array_fixed_length <= 0 ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+        self.array_fixed_length = array_fixed_length
+        self._rebuild(list(nums))
+
+    def __len__(self) -> int:
+        return len(self.values) - self.first
+
+    # Lay the windows of values out on the leaves of a new tree.
+    def _rebuild(self, values):
+        k = self.array_fixed_length
+        self.values = values
+        # position in values of the first live value, leaf i holds the
+        # window starting at values[i]
+        self.first = 0
+        window_count = max(0, len(values) - k + 1)
+        self.size = 1
+        while ( self.size < 2 * window_count ):
+            self.size *= 2
+        self.tree = [-math.inf] * (2 * self.size)
+        self.lazy = [0] * (2 * self.size)
+
+        if window_count:
+            curr_sum = sum(values[:k])
+            self.tree[self.size] = curr_sum
+            for i in range(1, window_count):
+                curr_sum += values[i + k - 1] - values[i - 1]
+                self.tree[self.size + i] = curr_sum
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def _push(self, node):
+        if self.lazy[node]:
+            for child in (2 * node, 2 * node + 1):
+                self.tree[child] += self.lazy[node]
+                self.lazy[child] += self.lazy[node]
+            self.lazy[node] = 0
+
+    # Add delta to leaves left..right (inclusive).
+    def _add(self, node, low, high, left, right, delta):
+        if ( right < low or high < left ):
+            return
+        if ( left <= low and high <= right ):
+            self.tree[node] += delta
+            self.lazy[node] += delta
+            return
+        self._push(node)
+        middle = (low + high) // 2
+        self._add(2 * node, low, middle, left, right, delta)
+        self._add(2 * node + 1, middle + 1, high, left, right, delta)
+        self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    # Walk from the root to a leaf, pushing the pending adds down.
+    def _path_to(self, leaf):
+        node, low, high = 1, 0, self.size - 1
+        path = []
+        while ( low != high ):
+            self._push(node)
+            path.append(node)
+            middle = (low + high) // 2
+            if ( leaf <= middle ):
+                node, high = 2 * node, middle
+            else:
+                node, low = 2 * node + 1, middle + 1
+        return node, path
+
+    def _set(self, leaf, value):
+        node, path = self._path_to(leaf)
+        self.tree[node] = value
+        for node in reversed(path):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def _get(self, leaf):
+        return self.tree[self._path_to(leaf)[0]]
+
+    def update(self, index : int, value : int):
+        if not ( 0 <= index < len(self) ):
+            raise IndexError("index out of range")
+        position = self.first + index
+        delta = value - self.values[position]
+        self.values[position] = value
+        left = max(self.first, position - self.array_fixed_length + 1)
+        right = min(position, len(self.values) - self.array_fixed_length)
+        if ( delta and left <= right ):
+            self._add(1, 0, self.size - 1, left, right, delta)
+
+    def append(self, value : int):
+        self.values.append(value)
+        leaf = len(self.values) - self.array_fixed_length
+        if ( leaf < self.first ):
+            return
+        if ( leaf >= self.size ):
+            self._rebuild(self.values[self.first:])
+            return
+        if ( leaf == self.first ):
+            window_sum = sum(self.values[leaf:])
+        else:
+            window_sum = (self._get(leaf - 1) + value
+                          - self.values[leaf - 1])
+        self._set(leaf, window_sum)
+
+    def pop_left(self) -> int:
+        if ( len(self) == 0 ):
+            raise IndexError("pop from an empty window")
+        value = self.values[self.first]
+        if ( self.first <= len(self.values) - self.array_fixed_length ):
+            self._set(self.first, -math.inf)
+        self.first += 1
+        if ( 2 * self.first > len(self.values) ):
+            self._rebuild(self.values[self.first:])
+        return value
+
+    def best(self) -> tuple[int, int, int]:
+        if ( self.tree[1] == -math.inf ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+        # follow the maximum down, left child first on ties
+        node = 1
+        while ( node < self.size ):
+            self._push(node)
+            node = 2 * node if self.tree[2 * node] == self.tree[node] \
+                   else 2 * node + 1
+        start = node - self.size - self.first
+        return self.tree[node], start, start + self.array_fixed_length
+
+    def best_average(self) -> float:
+        return self.best()[0] / self.array_fixed_length
+
+'''
+File backed execution of the SlidingWindow methods.
+    * The source can be the path of a file of native int64 values, a
+      numpy array / numpy.memmap, an array('q') or a raw bytes-like
+      buffer of int64 values. Files are opened with mmap so nothing is
+      read into python objects up front.
+    * The right pointer walks the data in chunks of chunk_items values,
+      each chunk converted to python ints in one go. The left pointer
+      reads single values straight from the mapped data, so the window
+      state carries across chunk boundaries and never needs a copy of
+      the window.
+    * Memory use is one chunk no matter how large the file is, and the
+      results match the in-memory SlidingWindow methods.
+'''
+class ChunkedSlidingWindow:
+
+    #Constructor method
+    def __init__(self, chunk_items : int = 1 << 20):
+        if ( chunk_items <= 0 ):
+            raise ValueError("chunk_items must be positive")
+        self.chunk_items = chunk_items
+
+    # Yield (offset, list of values) for every chunk of the source.
+    def _chunks(self, values):
+        for start in range(0, len(values), self.chunk_items):
+            piece = values[start:start + self.chunk_items]
+            if isinstance(piece, memoryview):
+                # release the slice right away so the mmap can be closed
+                with piece:
+                    chunk = piece.tolist()
+            elif hasattr(piece, "tolist"):
+                chunk = piece.tolist()
+            else:
+                chunk = list(piece)
+            yield start, chunk
+
+    @utility_decorator
+    def find_longest_subarray_length(self, source, sum : int) -> int:
+        with open_int64_source(source) as values:
+            left_index = curr_sum = long_window_length = 0
+            for offset, chunk in self._chunks(values):
+                for right_index, value in enumerate(chunk, offset):
+                    curr_sum += value
+                    while ( curr_sum > sum ):
+                        curr_sum -= int(values[left_index])
+                        left_index += 1
+                    long_window_length = max(long_window_length,
+                                             right_index - left_index + 1)
+        return long_window_length
+
+    # Best fixed length window sum without any division.
+    def _max_window_sum(self, values, array_fixed_length):
+        if not ( 0 < array_fixed_length <= len(values) ):
+            raise ValueError("Window length must be between 1 and "
+                             "the list length")
+        curr_sum = 0
+        max_sum = None
+        for offset, chunk in self._chunks(values):
+            for i, value in enumerate(chunk, offset):
+                curr_sum += value
+                if ( i >= array_fixed_length ):
+                    curr_sum -= int(values[i - array_fixed_length])
+                if ( i >= array_fixed_length - 1 ):
+                    if ( max_sum is None or curr_sum > max_sum ):
+                        max_sum = curr_sum
+        return max_sum
+
+    @utility_decorator
+    def find_max_sum_in_fixed_sub_array(self, source,
+                                        array_fixed_length : int) -> int:
+        with open_int64_source(source) as values:
+            return self._max_window_sum(values, array_fixed_length)
+
+    @utility_decorator
+    def find_max_average(self, source, fixed_array_length : int) -> float:
+        with open_int64_source(source) as values:
+            max_sum = self._max_window_sum(values, fixed_array_length)
+        return max_sum / fixed_array_length
+
+    @utility_decorator
+    def find_longest_ones_in_list(self, source, k : int) -> int:
+        with open_int64_source(source) as values:
+            zeroes_count = left_index = window_length = 0
+            for offset, chunk in self._chunks(values):
+                for right_index, value in enumerate(chunk, offset):
+                    if ( value == 0 ):
+                        zeroes_count += 1
+                    while ( zeroes_count > k ):
+                        if ( values[left_index] == 0 ):
+                            zeroes_count -= 1
+                        left_index += 1
+                    window_length = max(window_length,
+                                        right_index - left_index + 1)
+        return window_length
+
+'''
+Open a source of int64 values as something indexable with len().
+Paths are memory mapped and exposed as a memoryview cast to int64,
+raw byte buffers are cast the same way, numpy arrays, array('q') and
+lists are used as they are.
+'''
+@contextlib.contextmanager
+def open_int64_source(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            if ( os.fstat(file.fileno()).st_size == 0 ):
+                raise ValueError("List cant be empty")
+            with mmap.mmap(file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                values = memoryview(mapped).cast("q")
+                try:
+                    yield values
+                finally:
+                    values.release()
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        values = memoryview(source)
+        if ( values.format != "q" ):
+            values = values.cast("B").cast("q")
+    else:
+        values = source
+
+    if ( len(values) == 0 ):
+        raise ValueError("List cant be empty")
+    yield values
+
+'''
+Mergeable summary of a chunk for the "longest window with at most k
+zeroes" problem (find_longest_ones_in_list, and
+flip_zeroes_subarray_length with k = 1).
+    * A chunk is described by its length, its zero count, the positions
+      of its first and last k + 1 zeroes and the best window inside it.
+      That is O(k) no matter how long the chunk is.
+    * merge(other) gives the summary of the two chunks side by side. A
+      window crossing the boundary takes j zeroes from the end of the
+      left chunk and k - j from the start of the right one, so trying
+      every j finds the best crossing window. merge is associative, so
+      summaries computed in any grouping combine to the exact answer.
+'''
+class ZeroWindowSummary:
+
+    #Constructor method
+    def __init__(self, length, zero_count, first_zeros, last_zeros, best):
+        self.length = length
+        self.zero_count = zero_count
+        self.first_zeros = first_zeros
+        self.last_zeros = last_zeros
+        self.best = best
+
+    # Summary of a bytes object where a 0 byte marks a zero.
+    @classmethod
+    def from_bytes(cls, data : bytes, k : int):
+        positions = _zero_positions(data)
+        best = LongestOnesIndex.from_zero_positions(
+                    positions, len(data)).query(k)[0]
+        return cls(len(data), len(positions), positions[:k + 1],
+                   positions[-(k + 1):], best)
+
+    def merge(self, other, k : int):
+        crossing = 0
+        for j in range(k + 1):
+            # longest run at the end of self with at most j zeroes
+            if ( self.zero_count <= j ):
+                left_length = self.length
+            else:
+                left_length = self.length - 1 - self.last_zeros[-(j + 1)]
+            # longest run at the start of other with at most k - j zeroes
+            if ( other.zero_count <= k - j ):
+                right_length = other.length
+            else:
+                right_length = other.first_zeros[k - j]
+            crossing = max(crossing, left_length + right_length)
+
+        first_zeros = self.first_zeros[:k + 1]
+        if ( len(first_zeros) <= k ):
+            first_zeros = first_zeros + [position + self.length
+                                         for position in other.first_zeros]
+        last_zeros = [position + self.length
+                      for position in other.last_zeros]
+        if ( len(last_zeros) <= k ):
+            last_zeros = self.last_zeros + last_zeros
+
+        return ZeroWindowSummary(self.length + other.length,
+                                 self.zero_count + other.zero_count,
+                                 first_zeros[:k + 1],
+                                 last_zeros[-(k + 1):],
+                                 max(self.best, other.best, crossing))
+
+# Process pool worker: summary of data[start:stop] in a shared segment.
+def _zero_window_summary(name, start, stop, k):
+    with attach_shared_buffer(name) as buffer:
+        data = bytes(buffer[start:stop])
+    return ZeroWindowSummary.from_bytes(data, k)
+
+# One byte per element, 0 for a zero. This runs serially in the calling
+# process before any work goes to the pool; lists go through numpy when
+# it is available, which is far faster than a python generator.
+def _zero_flag_bytes(nums) -> bytes:
+    if isinstance(nums, (bytes, bytearray)):
+        return bytes(nums)
+    if np is not None:
+        return (np.asarray(nums) != 0).astype(np.uint8).tobytes()
+    return bytes(0 if value == 0 else 1 for value in nums)
+
+def _zero_char_bytes(binary_string) -> bytes:
+    return binary_string.encode("latin-1").translate(_ZERO_CHAR_TABLE)
+
+# translation table turning "0" into a 0 byte and anything else into 1
+_ZERO_CHAR_TABLE = bytes(0 if byte == ord("0") else 1 for byte in range(256))
+
+'''
+Parallel version of the zero counting window methods.
+    * The input is turned into one byte per element (0 for a zero) and
+      copied into shared memory once. That conversion is serial (numpy
+      when available) and bounds the speedup. Worker processes summarize their
+      own ranges straight from the shared segment, and the summaries are
+      merged in order to get the exact answer, including windows that
+      cross chunk boundaries.
+    * processes=1 computes the summaries in this process, which is handy
+      as a baseline for the speedup report in Benchmark_Module.
+'''
+class ParallelZeroWindow:
+
+    #Constructor method
+    def __init__(self, processes : int = None, chunks_per_process : int = 4):
+        self.processes = processes or os.cpu_count() or 1
+        self.chunks_per_process = chunks_per_process
+
+    @utility_decorator
+    def find_longest_ones_in_list(self, nums, k : int) -> int:
+        if ( len(nums) == 0 ):
+            raise ValueError("List can't be empty")
+        return self._longest_window(_zero_flag_bytes(nums), k)
+
+    @utility_decorator
+    def flip_zeroes_subarray_length(self, binary_string : str) -> int:
+        if ( len(binary_string) == 0 ):
+            raise ValueError("List can't be empty")
+        return self._longest_window(_zero_char_bytes(binary_string), 1)
+
+    def _longest_window(self, data : bytes, k : int) -> int:
+        if ( k < 0 ):
+            raise ValueError("k can't be negative")
+        chunk_count = max(1, min(len(data),
+                                 self.processes * self.chunks_per_process))
+        bounds = [len(data) * i // chunk_count for i in range(chunk_count + 1)]
+        ranges = list(zip(bounds, bounds[1:]))
+
+        if ( self.processes == 1 ):
+            summaries = [ZeroWindowSummary.from_bytes(data[start:stop], k)
+                         for start, stop in ranges]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with shared_buffers(data) as (name,), \
+                 ProcessPoolExecutor(self.processes) as pool:
+                futures = [pool.submit(_zero_window_summary,
+                                       name, start, stop, k)
+                           for start, stop in ranges]
+                summaries = [future.result() for future in futures]
+
+        summary = summaries[0]
+        for other in summaries[1:]:
+            summary = summary.merge(other, k)
+        return summary.best
+
+# k largest entries of a window series as [(value, start)], best first.
+# Windows equal to the k-th value are taken from the left, so ties come
+# out the same as on the heap path.
+def _top_k_vectorized(series, k) -> list[tuple]:
+    k = min(k, len(series))
+    if ( k == 0 ):
+        return []
+    kth_value = np.partition(series, len(series) - k)[len(series) - k]
+    above = np.flatnonzero(series > kth_value)
+    equal = np.flatnonzero(series == kth_value)[:k - len(above)]
+    top = np.concatenate((above, equal))
+    top = top[np.lexsort((top, -series[top]))]
+    return list(zip(series[top].tolist(), top.tolist()))
+
+# Greedy best first pick of up to k windows that don't overlap.
+def _pick_non_overlapping(series, array_fixed_length, k) -> list[tuple]:
+    if np is not None and isinstance(series, np.ndarray):
+        order = np.argsort(-series, kind="stable").tolist()
+        series = series.tolist()
+    else:
+        order = sorted(range(len(series)), key=lambda i: -series[i])
+
+    picked_starts = []
+    picked = []
+    for start in order:
+        if ( len(picked) == k ):
+            break
+        position = bisect.bisect_left(picked_starts, start)
+        if ( position > 0 and
+             picked_starts[position - 1] > start - array_fixed_length ):
+            continue
+        if ( position < len(picked_starts) and
+             picked_starts[position] < start + array_fixed_length ):
+            continue
+        picked_starts.insert(position, start)
+        picked.append((series[start], start))
+    return picked
+
+# Kernels of the batch methods, see ragged_batch in Utility_Module.
+def _max_sum_kernel(values, offsets, first, last, array_fixed_length):
+    results = array("q")
+    for item in range(first, last):
+        start = offsets[item]
+        curr_sum = max_sum = sum(values[start:start + array_fixed_length])
+        for right_index in range(start + array_fixed_length,
+                                 offsets[item + 1]):
+            curr_sum += values[right_index] - values[right_index -
+                                                     array_fixed_length]
+            if ( curr_sum > max_sum ):
+                max_sum = curr_sum
+        results.append(max_sum)
+    return results
+
+def _longest_ones_kernel(values, offsets, first, last, k):
+    results = array("q")
+    for item in range(first, last):
+        start = left_index = offsets[item]
+        window_length = zeroes_count = 0
+        for right_index in range(start, offsets[item + 1]):
+            if ( values[right_index] == 0 ):
+                zeroes_count += 1
+                while ( zeroes_count > k ):
+                    if ( values[left_index] == 0 ):
+                        zeroes_count -= 1
+                    left_index += 1
+            if ( right_index - left_index + 1 > window_length ):
+                window_length = right_index - left_index + 1
+        results.append(window_length)
+    return results
+
+# Positions of the "0" characters in a str or bytes.
+def _char_zero_positions(binary_string) -> list[int]:
+    zero = "0" if isinstance(binary_string, str) else b"0"
+    positions = []
+    position = binary_string.find(zero)
+    while ( position != -1 ):
+        positions.append(position)
+        position = binary_string.find(zero, position + 1)
+    return positions
+
+# bit offsets (most significant first) of the zero bits of every byte
+_ZERO_BITS = [tuple(bit for bit in range(8) if not byte & (0x80 >> bit))
+              for byte in range(256)]
+_NOT_ALL_ONES = re.compile(rb"[^\xff]")
+
+# Positions of the zero bits among the first length bits of a bitset.
+def _packed_zero_positions(bitset, length) -> list[int]:
+    positions = []
+    for match in _NOT_ALL_ONES.finditer(bytes(bitset)):
+        byte_index = match.start()
+        for bit in _ZERO_BITS[bitset[byte_index]]:
+            position = 8 * byte_index + bit
+            if ( position < length ):
+                positions.append(position)
+    return positions
+
+# Split a list of non-negative ints into its runs without zeros.
+def _zero_free_segments(nums) -> list[list[int]]:
+    segments = []
+    segment = []
+    for value in nums:
+        if ( value < 0 ):
+            raise ValueError("Negative values are not supported")
+        if ( value == 0 ):
+            if segment:
+                segments.append(segment)
+            segment = []
+        else:
+            segment.append(value)
+    if segment:
+        segments.append(segment)
+    return segments
+
+# One pass over a zero free segment with one window per threshold.
+def _count_below_exact(segment, thresholds) -> list[int]:
+    left_indexes = [0] * len(thresholds)
+    products = [1] * len(thresholds)
+    counts = [0] * len(thresholds)
+    for right_index, value in enumerate(segment):
+        for t, threshold in enumerate(thresholds):
+            if ( threshold <= 1 ):
+                continue
+            product = products[t] * value
+            left_index = left_indexes[t]
+            while ( product >= threshold ):
+                product //= segment[left_index]
+                left_index += 1
+            products[t] = product
+            left_indexes[t] = left_index
+            counts[t] += right_index - left_index + 1
+    return counts
+
+# Count windows with sum of logs < log(threshold) by binary search over
+# the prefix sums of logs. Left ends whose log sum is within rounding
+# distance of log(threshold) are settled with an exact product instead.
+def _count_below_log_space(segment, thresholds) -> list[int]:
+    counts = []
+    if np is not None:
+        try:
+            logs = np.log(np.asarray(segment, dtype=np.float64))
+        except OverflowError:
+            # ints too large for a float still have a log
+            logs = np.array([math.log(value) for value in segment])
+        prefix = np.zeros(len(segment) + 1)
+        np.cumsum(logs, out=prefix[1:])
+        right_ends = np.arange(1, len(segment) + 1)
+        for threshold in thresholds:
+            if ( threshold <= 1 ):
+                counts.append(0)
+                continue
+            log_threshold = math.log(threshold)
+            bounds = prefix[1:] - log_threshold
+            tolerance = _LOG_TOLERANCE * (np.abs(prefix[1:])
+                                          + abs(log_threshold) + 1)
+            # left ends below low are surely too long, from high on
+            # surely short enough
+            lows = np.minimum(np.searchsorted(prefix, bounds - tolerance,
+                                              side="right"), right_ends)
+            highs = np.minimum(np.searchsorted(prefix, bounds + tolerance,
+                                               side="right"), right_ends)
+            count = int((right_ends - highs).sum())
+            for right in np.flatnonzero(lows < highs).tolist():
+                count += _count_borderline(segment, int(lows[right]),
+                                           int(highs[right]), right + 1,
+                                           threshold)
+            counts.append(count)
+        return counts
+
+    prefix = [0.0]
+    prefix.extend(itertools.accumulate(math.log(value) for value in segment))
+    for threshold in thresholds:
+        if ( threshold <= 1 ):
+            counts.append(0)
+            continue
+        log_threshold = math.log(threshold)
+        count = 0
+        for right_index in range(1, len(prefix)):
+            bound = prefix[right_index] - log_threshold
+            tolerance = _LOG_TOLERANCE * (abs(prefix[right_index])
+                                          + abs(log_threshold) + 1)
+            low = min(right_index, bisect.bisect_right(
+                        prefix, bound - tolerance, 0, right_index))
+            high = min(right_index, bisect.bisect_right(
+                        prefix, bound + tolerance, 0, right_index))
+            count += right_index - high
+            if ( low < high ):
+                count += _count_borderline(segment, low, high, right_index,
+                                           threshold)
+        counts.append(count)
+    return counts
+
+# relative slack on log sums covering float rounding in the prefix sums
+_LOG_TOLERANCE = 1e-9
+
+# Left ends in [low, high) of windows ending before right whose exact
+# product is below threshold. The product only shrinks as the left end
+# moves right, so the first valid one is binary searched.
+def _count_borderline(segment, low, high, right, threshold) -> int:
+    first_valid = high
+    while ( low < first_valid ):
+        middle = (low + first_valid) // 2
+        if ( math.prod(segment[middle:right]) < threshold ):
+            first_valid = middle
+        else:
+            low = middle + 1
+    return high - first_valid
+
+'''
+Associative aggregate for AggregateWindow: combine(a, b) must be
+associative and identity neutral for it. lift turns an input value into
+an aggregate value first (None means the value is used as it is).
+'''
+Aggregate = namedtuple("Aggregate", ["combine", "identity", "lift"],
+                       defaults=[None])
+
+'''
+Presets for the constraint metrics of the window methods. The existing
+methods map onto them:
+    * find_longest_subarray_length(nums, s) is
+      find_longest_window_where(nums, lambda total: total <= s, "sum")
+    * find_longest_ones_in_list(nums, k) is
+      find_longest_window_where(nums, lambda zeroes: zeroes <= k,
+                                "zero_count")
+    * flip_zeroes_subarray_length(binary_string) is the same over the
+      string with "zero_char_count" and k = 1
+    * find_max_sum_in_fixed_sub_array(nums, k) is
+      max(fixed_window_aggregates(nums, k, "sum"))
+"distinct" combines frozensets, so its cost per step grows with the
+number of distinct values in the window; the others are O(1).
+'''
+AGGREGATE_PRESETS = {
+    "sum": Aggregate(operator.add, 0),
+    "max": Aggregate(max, -math.inf),
+    "min": Aggregate(min, math.inf),
+    "gcd": Aggregate(math.gcd, 0),
+    "or": Aggregate(operator.or_, 0),
+    "zero_count": Aggregate(operator.add, 0,
+                            lambda value: 1 if value == 0 else 0),
+    "zero_char_count": Aggregate(operator.add, 0,
+                                 lambda char: 1 if char == "0" else 0),
+    "distinct": Aggregate(operator.or_, frozenset(),
+                          lambda value: frozenset((value,))),
+}
+
+'''
+Sliding window over any associative aggregate (two stack queue).
+    * New values go on the back stack, which keeps a running aggregate.
+    * Values leave from the front stack, where every entry stores the
+      aggregate of itself and everything newer in the front stack.
+      When the front stack is empty the back stack is moved over in one
+      go, building those aggregates.
+    * Every value is moved once, so push, pop and query are O(1)
+      amortized calls to combine, and the order of values is kept, so
+      combine doesn't need to be commutative.
+'''
+class AggregateWindow:
+
+    #Constructor method
+    def __init__(self, aggregate = "sum"):
+        if isinstance(aggregate, str):
+            aggregate = AGGREGATE_PRESETS[aggregate]
+        elif not isinstance(aggregate, Aggregate):
+            aggregate = Aggregate(*aggregate)
+        self.combine = aggregate.combine
+        self.identity = aggregate.identity
+        self.lift = aggregate.lift
+        #(value, aggregate of value and the newer front values)
+        self.front = []
+        self.back = []
+        self.back_aggregate = self.identity
+
+    def __len__(self):
+        return len(self.front) + len(self.back)
+
+    def push(self, value):
+        if self.lift is not None:
+            value = self.lift(value)
+        self.back.append(value)
+        self.back_aggregate = self.combine(self.back_aggregate, value)
+
+    # Remove the oldest value and return it (lifted).
+    def pop(self):
+        if not self.front:
+            if not self.back:
+                raise IndexError("pop from an empty window")
+            aggregate = self.identity
+            while self.back:
+                value = self.back.pop()
+                aggregate = self.combine(value, aggregate)
+                self.front.append((value, aggregate))
+            self.back_aggregate = self.identity
+        return self.front.pop()[0]
+
+    # Aggregate of the whole window, oldest to newest.
+    def query(self):
+        front_aggregate = self.front[-1][1] if self.front else self.identity
+        return self.combine(front_aggregate, self.back_aggregate)
+
+# values converted from an ndarray at a time by _window_values
+WINDOW_CHUNK_ITEMS = 1 << 16
+
+# Iterator over the input as python values, after validating the window
+# length. ndarrays are converted in bounded chunks, never copied whole.
+def _window_values(nums, array_fixed_length):
+    if (len(nums) == 0):
+        raise ValueError("List cant be empty")
+    if not ( 0 < array_fixed_length <= len(nums) ):
+        raise ValueError("Window length must be between 1 and "
+                         "the list length")
+    if hasattr(nums, "tolist"):
+        return _chunked_values(nums)
+    return iter(nums)
+
+def _chunked_values(nums):
+    for first in range(0, len(nums), WINDOW_CHUNK_ITEMS):
+        yield from nums[first:first + WINDOW_CHUNK_ITEMS].tolist()
+
+# array typecode of a list's values: "q" while they are ints that fit in
+# int64, "d" for ints and floats, None for anything else. Only scans the
+# list, without building a copy of it.
+def _list_typecode(values):
+    if all(isinstance(value, int) for value in values):
+        if ( -(1 << 63) <= min(values) and max(values) < 1 << 63 ):
+            return "q"
+        return None
+    if all(isinstance(value, (int, float)) for value in values):
+        return "d"
+    return None
+
+# Check the caller's output buffer or preallocate one for the
+# n - k + 1 window results.
+def _window_output(nums, array_fixed_length, out, floating):
+    count = len(nums) - array_fixed_length + 1
+    if out is not None:
+        if ( len(out) != count ):
+            raise ValueError(f"out must have {count} items")
+        return out
+    if np is not None and isinstance(nums, np.ndarray):
+        return np.empty(count,
+                        dtype=np.float64 if floating else nums.dtype)
+    typecode = "d" if floating else _list_typecode(nums)
+    if np is not None:
+        dtype = {"q": np.int64, "d": np.float64}.get(typecode, object)
+        return np.empty(count, dtype=dtype)
+    if typecode is None:
+        return [None] * count
+    return array(typecode, bytes(8 * count))
+
+# Monotonic deque pass. drop(back, value) is True when the value at the
+# back of the deque can never be the answer again once value arrived.
+def _rolling_extreme(nums, array_fixed_length, out, drop):
+    values = _window_values(nums, array_fixed_length)
+    out = _window_output(nums, array_fixed_length, out, False)
+    #(index, value) of the candidates, best in front
+    candidates = deque()
+    for i, value in enumerate(values):
+        while ( candidates and drop(candidates[-1][1], value) ):
+            candidates.pop()
+        candidates.append((i, value))
+        if ( candidates[0][0] <= i - array_fixed_length ):
+            candidates.popleft()
+        if ( i >= array_fixed_length - 1 ):
+            out[i - array_fixed_length + 1] = candidates[0][1]
+    return out
+
+'''
+Two heap median with lazy deletion, used by rolling_median. low is a max
+heap (values stored negated) holding the lower half, high a min heap
+with the upper half. low has as many valid values as high, or one more.
+'''
+class _RollingMedian:
+
+    def __init__(self):
+        self.low = []
+        self.high = []
+        self.low_size = self.high_size = 0
+        #value -> number of copies waiting to be removed from a heap
+        self.delayed = Counter()
+
+    def add(self, value):
+        if ( not self.low or value <= -self.low[0] ):
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._rebalance()
+
+    def remove(self, value):
+        self.delayed[value] += 1
+        if ( value <= -self.low[0] ):
+            self.low_size -= 1
+            if ( value == -self.low[0] ):
+                self._prune_low()
+        else:
+            self.high_size -= 1
+            if ( value == self.high[0] ):
+                self._prune_high()
+        self._rebalance()
+
+    def median(self):
+        if ( self.low_size > self.high_size ):
+            return float(-self.low[0])
+        return (-self.low[0] + self.high[0]) / 2
+
+    # drop values waiting for removal from the top of each heap
+    def _prune_low(self):
+        while ( self.low and self.delayed[-self.low[0]] ):
+            self.delayed[-self.low[0]] -= 1
+            heapq.heappop(self.low)
+
+    def _prune_high(self):
+        while ( self.high and self.delayed[self.high[0]] ):
+            self.delayed[self.high[0]] -= 1
+            heapq.heappop(self.high)
+
+    def _rebalance(self):
+        if ( self.low_size > self.high_size + 1 ):
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune_low()
+        elif ( self.low_size < self.high_size ):
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.low_size += 1
+            self.high_size -= 1
+            self._prune_high()
+
+'''
+asyncio front-end for the streaming window engines.
+    * source is an async iterator of values, or of chunks of values
+      (lists, array.array, bytes, numpy arrays).
+    * A reader task pulls from source into a queue of at most
+      max_pending items (values or chunks). When the consumer of the
+      results is slow the queue fills up and the reader stops pulling
+      from source, so memory stays bounded.
+    * Every method is an async generator that publishes a new result as
+      soon as the answer changes, instead of waiting for a whole batch.
+'''
+class AsyncSlidingWindow:
+
+    #Constructor method
+    def __init__(self, max_pending : int = 1024):
+        if ( max_pending <= 0 ):
+            raise ValueError("max_pending must be positive")
+        self.max_pending = max_pending
+
+    # Values from source, read ahead through the bounded queue.
+    async def _values(self, source):
+        import asyncio
+
+        queue = asyncio.Queue(self.max_pending)
+        end_of_stream = object()
+
+        async def reader():
+            try:
+                async for item in source:
+                    await queue.put(item)
+            except Exception as error:
+                await queue.put(_ReaderError(error))
+            else:
+                await queue.put(end_of_stream)
+
+        reader_task = asyncio.create_task(reader())
+        try:
+            while True:
+                item = await queue.get()
+                if item is end_of_stream:
+                    break
+                if isinstance(item, _ReaderError):
+                    raise item.error
+                # numpy scalars and 0-d arrays are single values too
+                if ( isinstance(item, numbers.Number)
+                     or getattr(item, "ndim", None) == 0 ):
+                    yield item
+                else:
+                    for value in (item.tolist() if hasattr(item, "tolist")
+                                  else item):
+                        yield value
+        finally:
+            reader_task.cancel()
+
+    # Yields (length, start, end) every time the longest window grows.
+    async def longest_subarray_updates(self, source, sum : int):
+        stream = StreamingLongestSubarray(sum)
+        longest_length = 0
+        async for value in self._values(source):
+            if ( stream.push(value) > longest_length ):
+                longest_length = stream.longest_length
+                yield stream.result()
+
+    # Yields (length, start, end) every time the longest window grows.
+    async def longest_ones_updates(self, source, k : int):
+        stream = StreamingLongestOnes(k)
+        longest_length = 0
+        async for value in self._values(source):
+            if ( stream.push(value) > longest_length ):
+                longest_length = stream.longest_length
+                yield stream.result()
+
+    # Yields (max_sum, start) every time a better window shows up.
+    async def max_sum_updates(self, source, array_fixed_length : int):
+        stream = StreamingMaxWindowSum(array_fixed_length)
+        best_start = None
+        async for value in self._values(source):
+            stream.push(value)
+            if ( stream.best_start != best_start ):
+                best_start = stream.best_start
+                yield stream.result()
+
+# Carries an exception from the reader task to the consumer.
+class _ReaderError:
+
+    def __init__(self, error):
+        self.error = error
+
 def test_class_methods():
 
     #Initialize the class
@@ -261,12 +1986,31 @@ def test_class_methods():
                                                           target_sum)
     print(f"longest subarray length a sum less than or equal to {target_sum} is : {result}")
 
+    #Test the streaming version over a generator
+    stream = StreamingLongestSubarray(target_sum)
+    stream.push_many(value for value in num_list)
+    print(f"streaming longest subarray (length, start, end) : {stream.result()}")
+
+    #Many sum limits, over the whole list or a range of it, from one index
+    prefix_index = sliding_window.build_prefix_sum_index(num_list)
+    print(f"(length, start, end) for sums 5, 9 and 9 within [3, 9) : "
+          f"{prefix_index.query_many([5, 9, (9, 3, 9)])}")
+
     print ("-" * 60)
     #test the zeroes length
     binary_str = "1101100111"
     zeroes_length = sliding_window.flip_zeroes_subarray_length(binary_str)
     print(f"zeroes max length : {zeroes_length}")
 
+    #same answer from the zero positions, and from a packed bitset
+    fast_length = sliding_window.flip_zeroes_subarray_length_fast(binary_str)
+    padded = binary_str.ljust(16, "1")
+    packed = int(padded, 2).to_bytes(2, "big")
+    packed_length = sliding_window.flip_zeroes_subarray_length_fast(
+                        packed, packed_length=len(binary_str))
+    print(f"zeroes max length (fast) : {fast_length}, "
+          f"packed : {packed_length}")
+
     print("-" * 60)
     #Test the valid subarrays method
     num_list = [10, 5, 2, 6]
@@ -275,6 +2019,12 @@ def test_class_methods():
                                                                   match_val)
     print(f"no_of_valid_arrays is : {no_of_valid_arrays} ")
 
+    #Test a ladder of thresholds, zeros included
+    thresholds = [10, 100, 1000]
+    counts = sliding_window.count_subarrays_below_thresholds(
+                [10, 5, 0, 2, 6], thresholds)
+    print(f"valid subarrays for {thresholds} : {counts}")
+
     print("-" * 60)
     #Test the max sum method
     num_list = [3, -1, 4, 12, -8, 5, 6]
@@ -283,6 +2033,19 @@ def test_class_methods():
     max_sum = sliding_window.find_max_sum_in_fixed_sub_array(num_list, 4)
     print(f"Max value in {num_list} is : {max_sum}")
 
+    #Test the whole window sum series
+    series, best_index, best_sum = sliding_window.fixed_window_series(
+                                        num_list, array_range)
+    print(f"Window sums : {[int(s) for s in series]}, best window starts at "
+          f"{best_index} with sum {best_sum}")
+
+    #Test the three best windows, then the three best that don't overlap
+    print(f"Top 3 windows (sum, start) : "
+          f"{sliding_window.find_top_k_windows(num_list, array_range, 3)}")
+    top_windows = sliding_window.find_top_k_windows(num_list, array_range, 3,
+                                                    non_overlapping=True)
+    print(f"Top 3 non overlapping windows (sum, start) : {top_windows}")
+
     print("-" * 60)
     #Test the max average method
     nums = [1, 12, -5, -6, 50, 3]
@@ -292,6 +2055,20 @@ def test_class_methods():
     max_avg = sliding_window.find_max_average(nums, fixed_arr_len)
     print(f" maximum average in {nums} is : {max_avg}")
 
+    #Keep the best window up to date while the list changes
+    live_windows = DynamicFixedWindowMax(nums, fixed_arr_len)
+    live_windows.update(0, 40)
+    live_windows.append(30)
+    live_windows.pop_left()
+    print(f" best (sum, start, end) after the changes : {live_windows.best()}"
+          f", average {live_windows.best_average()}")
+
+    #Test the rolling statistics over the same list
+    print(f" rolling max : {sliding_window.rolling_max(nums, 3).tolist()}")
+    print(f" rolling min : {sliding_window.rolling_min(nums, 3).tolist()}")
+    print(f" rolling median : "
+          f"{sliding_window.rolling_median(nums, 3).tolist()}")
+
     print ("-" * 60)
     #test the longest ones length
     binary_list = [0,0,1,1,0,0,1,1,1,0,1,1,0,0,0,1,1,1,1]
@@ -300,6 +2077,28 @@ def test_class_methods():
                                 binary_list, max_zeroes_to_flip)
     print(f"Ones max length : {max_ones_arr_length}")
 
+    #Test the generic window engine with a non invertible aggregate
+    rolling_gcd = sliding_window.fixed_window_aggregates([12, 18, 6, 9, 3],
+                                                         2, "gcd")
+    print(f"Rolling gcd : {rolling_gcd}")
+    longest = sliding_window.find_longest_window_where(
+                binary_list, lambda zeroes: zeroes <= max_zeroes_to_flip,
+                "zero_count")
+    print(f"Ones (length, start, end) through the engine : {longest}")
+
+    #test the prebuilt index for several k values at once
+    ones_index = LongestOnesIndex(binary_list)
+    print(f"Ones (length, start, end) for k = 0..4 : "
+          f"{ones_index.query_many(range(5))}")
+
+    #many small lists in one call, as a flat buffer plus offsets
+    values, offsets = pack_ragged([binary_list, [1, 0, 1], [0, 0]])
+    lengths = sliding_window.find_longest_ones_batch(values, offsets, 1)
+    print(f"Ones max length per list : {lengths.tolist()}")
+
 if __name__ == "__main__":
+    #set logging level at info. Only done when run as a script so
+    #importing the module doesn't configure logging for the caller.
+    log.basicConfig(level=log.INFO)
     test_class_methods()
 
@@ -0,0 +1,194 @@
+'''
+Batch runner for the TwoPointers and SlidingWindow methods.
+    * Reads a JSONL file of jobs, one JSON object per line:
+          {"id": 1, "method": "SlidingWindow.find_max_average",
+           "args": [[1, 12, -5, -6, 50, 3], 4], "kwargs": {}}
+      "id" and "kwargs" are optional, blank lines are skipped.
+    * Writes one JSONL result per job, in input order, with the result
+      or the error and the wall time of the call:
+          {"id": 1, "method": "...", "result": 12.75, "seconds": 1.2e-05}
+    * Jobs are sent to a process pool in chunks. Only a bounded number
+      of chunks is in flight, so the input is streamed and never held
+      in memory all at once. --workers 0 runs every job in this process.
+    * The algorithm modules are imported lazily, the first time a job
+      names one of their classes, so a job file that only uses
+      TwoPointers never imports the sliding window module.
+    * --profile runs every job under cProfile and adds the functions
+      with the highest cumulative time to its result.
+    * Nothing here is interactive, so it can run under a scheduler.
+
+Usage:
+    python Batch_Module.py jobs.jsonl --output results.jsonl
+    python Batch_Module.py jobs.jsonl --workers 0 --profile
+    cat jobs.jsonl | python Batch_Module.py - > results.jsonl
+'''
+import argparse
+import importlib
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+
+# class name -> (module, constructor arguments) of the classes jobs can
+# call methods on.
+JOB_CLASSES = {
+    "TwoPointers": ("01_two_pointer", ("batch",)),
+    "SlidingWindow": ("02_sliding_window", ()),
+}
+
+# how many functions a --profile result lists
+PROFILE_TOP = 10
+
+# one instance per class and process, created on first use
+_instances = {}
+
+# bound method for a "Class.method" name, importing its module if needed.
+def resolve_method(qualified_name):
+    class_name, _, method_name = qualified_name.partition(".")
+    if class_name not in JOB_CLASSES or not method_name:
+        raise ValueError(f"unknown method {qualified_name!r}")
+
+    instance = _instances.get(class_name)
+    if instance is None:
+        module_name, constructor_args = JOB_CLASSES[class_name]
+        module = importlib.import_module(module_name)
+        instance = getattr(module, class_name)(*constructor_args)
+        _instances[class_name] = instance
+
+    method = getattr(instance, method_name, None)
+    if method_name.startswith("_") or not callable(method):
+        raise ValueError(f"unknown method {qualified_name!r}")
+    return method
+
+# JSON for values json can't encode: arrays, numpy values, generators.
+def _to_json(value):
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    try:
+        return list(value)
+    except TypeError:
+        return repr(value)
+
+# Run method under cProfile and list the functions with the most
+# cumulative time.
+def _profile_call(method, args, kwargs):
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    value = profiler.runcall(method, *args, **kwargs)
+    stats = pstats.Stats(profiler).stats
+    top = sorted(stats.items(), key=lambda item: item[1][3],
+                 reverse=True)[:PROFILE_TOP]
+    profile = [{"function": f"{os.path.basename(file)}:{line}({name})",
+                "calls": calls, "seconds": own_seconds,
+                "cumulative_seconds": cumulative_seconds}
+               for (file, line, name),
+                   (_, calls, own_seconds, cumulative_seconds, _) in top]
+    return value, profile
+
+def run_job(job, profile=False):
+    result = {"id": job.get("id"), "method": job.get("method")}
+    try:
+        method = resolve_method(job["method"])
+        args = job.get("args", [])
+        kwargs = job.get("kwargs", {})
+        start = time.perf_counter()
+        if profile:
+            value, result["profile"] = _profile_call(method, args, kwargs)
+        else:
+            value = method(*args, **kwargs)
+        # generators do their work while they are consumed
+        if hasattr(value, "__next__"):
+            value = list(value)
+        result["seconds"] = time.perf_counter() - start
+        result["result"] = value
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+# Results of a chunk of jobs, run in a worker. Lines that failed to
+# parse arrive as ready made error results.
+def run_jobs(jobs, profile=False):
+    return [job["error_result"] if "error_result" in job
+            else run_job(job, profile) for job in jobs]
+
+def read_jobs(lines):
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("a job must be a JSON object")
+        except ValueError as error:
+            job = {"error_result": {"id": None, "line": line_number,
+                                    "error": f"invalid job: {error}"}}
+        yield job
+
+def _chunks(jobs, chunk_size):
+    jobs = iter(jobs)
+    while chunk := list(itertools.islice(jobs, chunk_size)):
+        yield chunk
+
+'''
+Run the jobs and yield their results in order. With workers the chunks
+go to a process pool, at most workers * 2 of them in flight.
+'''
+def run_batch(jobs, workers, chunk_size=64, profile=False):
+    chunks = _chunks(jobs, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            yield from run_jobs(chunk, profile)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(run_jobs, chunk, profile))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("jobs", help="JSONL job file, - for stdin")
+    parser.add_argument("--output", default="-",
+                        help="JSONL result file, - for stdout")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes, 0 to run in this process")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="jobs sent to a worker at a time")
+    parser.add_argument("--profile", action="store_true",
+                        help="add a cProfile summary to every result")
+    args = parser.parse_args(argv)
+    if args.workers < 0 or args.chunk_size < 1:
+        parser.error("--workers must be >= 0 and --chunk-size >= 1")
+
+    source = sys.stdin if args.jobs == "-" else open(args.jobs)
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    job_count = error_count = 0
+    start = time.perf_counter()
+    try:
+        for result in run_batch(read_jobs(source), args.workers,
+                                args.chunk_size, args.profile):
+            job_count += 1
+            error_count += "error" in result
+            output.write(json.dumps(result, default=_to_json) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"{job_count} jobs, {error_count} errors in "
+          f"{time.perf_counter() - start:.3f}s", file=sys.stderr)
+    return 1 if error_count else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
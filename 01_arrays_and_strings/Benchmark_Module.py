@@ -0,0 +1,650 @@
+'''
+Benchmark harness for the TwoPointers and SlidingWindow methods.
+    * The scaling benchmark runs every method at input sizes from 1e3 to
+      1e7, records the best wall time, the throughput (elements / sec)
+      and the peak memory traced by tracemalloc, and fits the empirical
+      growth exponent (slope of log(time) against log(n)). An O(n)
+      method should come out close to 1.
+    * Results are written to a JSON file. Passing --baseline compares
+      them with an earlier results file and exits with status 1 when a
+      method's time or memory grew by more than --threshold.
+    * The parallel report times ParallelZeroWindow against the serial
+      zero counting methods at different process counts.
+    * The merge report compares merge_sorted_iterables and
+      external_sort against folding the shards together with repeated
+      pairwise combine_sorted_array calls.
+    * The reverse report times reverse_buffer on bytearray, memoryview,
+      array.array and numpy buffers against the list of characters path
+      of reverse_string, at payload sizes from 1 MB to 1 GB.
+    * The batch report runs many small inputs through the ragged batch
+      methods (flat buffer plus offsets) at different process counts and
+      compares the items / sec with calling the single input method in
+      a loop.
+    * The dynamic report runs a mixed load of updates, appends, pops
+      and best window queries through DynamicFixedWindowMax and
+      against a list that is rescanned with
+      find_max_sum_in_fixed_sub_array on every query.
+    * The async report measures the end to end latency per event through
+      AsyncSlidingWindow, fed by a local queue or socket stand-in.
+    * Nothing here is interactive, so it can run under a scheduler.
+
+Usage:
+    python Benchmark_Module.py scaling --output results.json
+    python Benchmark_Module.py scaling --max-size 100000 \
+        --baseline results.json --threshold 0.25
+    python Benchmark_Module.py parallel --size 10000000 --processes 1 2 4 8
+    python Benchmark_Module.py merge --size 1000000 --shards 100
+    python Benchmark_Module.py reverse --sizes 1048576 1073741824
+    python Benchmark_Module.py async --events 100000 --transport socket
+    python Benchmark_Module.py batch --items 1000000 --item-size 16
+    python Benchmark_Module.py dynamic --size 100000 --operations 10000
+'''
+import argparse
+import asyncio
+import importlib
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from Utility_Module import pack_ragged
+
+two_pointer = importlib.import_module("01_two_pointer")
+sliding_window = importlib.import_module("02_sliding_window")
+
+DEFAULT_SIZES = [10 ** exponent for exponent in range(3, 8)]
+
+'''
+Input builders for every method. Each one takes the input size and a
+seeded random generator and returns the positional arguments. Inputs
+are chosen so the methods do their full scan instead of exiting early.
+'''
+def _random_ints(n, rng, low=0, high=10):
+    return [rng.randint(low, high) for _ in range(n)]
+
+def _random_bits(n, rng):
+    return [rng.randint(0, 1) for _ in range(n)]
+
+BENCHMARK_CASES = {
+    "TwoPointers.is_palindrome":
+        lambda n, rng: ("a" * n,),
+    "TwoPointers.check_for_target_sum":
+        lambda n, rng: (list(range(n)), -1),
+    "TwoPointers.combine_sorted_array":
+        lambda n, rng: (list(range(0, n, 2)), list(range(1, n, 2))),
+    "TwoPointers.is_subsequence":
+        lambda n, rng: ("b", "a" * n),
+    "TwoPointers.reverse_string":
+        lambda n, rng: (["a"] * n,),
+    "TwoPointers.squares_of_sorted_array":
+        lambda n, rng: (list(range(-(n // 2), n - n // 2)),),
+    "SlidingWindow.find_longest_subarray_length":
+        lambda n, rng: (_random_ints(n, rng), 50),
+    "SlidingWindow.flip_zeroes_subarray_length":
+        lambda n, rng: ("".join(map(str, _random_bits(n, rng))),),
+    "SlidingWindow.find_subarrays_that_match":
+        lambda n, rng: (_random_ints(n, rng, 1, 10), 1000),
+    "SlidingWindow.find_max_sum_in_fixed_sub_array":
+        lambda n, rng: (_random_ints(n, rng, -100, 100), 100),
+    "SlidingWindow.find_max_average":
+        lambda n, rng: (_random_ints(n, rng, -100, 100), 100),
+    "SlidingWindow.fixed_window_series":
+        lambda n, rng: (_random_ints(n, rng, -100, 100), 100),
+    "SlidingWindow.find_longest_ones_in_list":
+        lambda n, rng: (_random_bits(n, rng), 10),
+}
+
+# bound method for a "Class.method" name on a fresh instance.
+def resolve_method(qualified_name):
+    class_name, method_name = qualified_name.split(".")
+    if class_name == "TwoPointers":
+        instance = two_pointer.TwoPointers("benchmark")
+    else:
+        instance = getattr(sliding_window, class_name)()
+    return getattr(instance, method_name)
+
+# Best wall time over repeats. Inputs are built once up front, and one
+# untimed call first pays for lazy imports and other first call setup,
+# so a single repeat isn't a cold start.
+def time_call(method, args, repeats):
+    method(*args)
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        method(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# Peak traced allocation of a single call, measured separately from the
+# timing runs because tracemalloc slows everything down.
+def peak_memory(method, args):
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        method(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+# Least squares slope of log(y) against log(x).
+def growth_exponent(sizes, values):
+    points = [(math.log(size), math.log(value))
+              for size, value in zip(sizes, values) if value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    return numerator / denominator if denominator else None
+
+def run_scaling(methods, sizes, repeats, seed=0):
+    results = {}
+    for name in methods:
+        method = resolve_method(name)
+        record = {"sizes": [], "seconds": [], "throughput": [],
+                  "peak_bytes": []}
+        for size in sizes:
+            args = BENCHMARK_CASES[name](size, random.Random(seed))
+            seconds = time_call(method, args, repeats)
+            record["sizes"].append(size)
+            record["seconds"].append(seconds)
+            record["throughput"].append(size / seconds if seconds else None)
+            record["peak_bytes"].append(peak_memory(method, args))
+            print(f"{name:50} n={size:>9} {seconds:10.6f}s "
+                  f"{record['peak_bytes'][-1]:>12} bytes", file=sys.stderr)
+        record["exponent"] = growth_exponent(record["sizes"],
+                                             record["seconds"])
+        results[name] = record
+    return results
+
+'''
+Compare results against a baseline file. A regression is reported when
+the time or the peak memory of a method at a size present in both runs
+grew by more than the threshold (0.25 means 25%).
+'''
+def find_regressions(results, baseline, threshold):
+    regressions = []
+    for name, record in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        base_by_size = {size: index
+                        for index, size in enumerate(base["sizes"])}
+        for index, size in enumerate(record["sizes"]):
+            base_index = base_by_size.get(size)
+            if base_index is None:
+                continue
+            for metric in ("seconds", "peak_bytes"):
+                old = base[metric][base_index]
+                new = record[metric][index]
+                if old and new > old * (1 + threshold):
+                    regressions.append(
+                        f"{name} n={size} {metric}: {old} -> {new} "
+                        f"(+{(new / old - 1) * 100:.1f}%)")
+    return regressions
+
+'''
+Speedup of ParallelZeroWindow over the serial find_longest_ones_in_list
+and flip_zeroes_subarray_length. The parallel timings include turning
+the input into bytes and copying it into shared memory. Turning the
+input into bytes is serial, so its time is reported on its own as the
+part of the run that doesn't get faster with more processes.
+'''
+def run_parallel_report(size, k, process_counts, seed=0):
+    rng = random.Random(seed)
+    bits = _random_bits(size, rng)
+    binary_string = "".join(map(str, bits))
+    serial = sliding_window.SlidingWindow()
+
+    cases = {
+        "find_longest_ones_in_list": (
+            lambda: serial.find_longest_ones_in_list(bits, k),
+            lambda executor: executor.find_longest_ones_in_list(bits, k),
+            lambda: sliding_window._zero_flag_bytes(bits)),
+        "flip_zeroes_subarray_length": (
+            lambda: serial.flip_zeroes_subarray_length(binary_string),
+            lambda executor: executor.flip_zeroes_subarray_length(
+                                binary_string),
+            lambda: sliding_window._zero_char_bytes(binary_string)),
+    }
+    report = {}
+    for name, (serial_call, parallel_call, conversion) in cases.items():
+        serial_seconds = time_call(serial_call, (), 1)
+        conversion_seconds = time_call(conversion, (), 1)
+        print(f"{name:30} serial conversion {conversion_seconds:10.4f}s "
+              f"of {serial_seconds:.4f}s serial run")
+        rows = []
+        for processes in process_counts:
+            executor = sliding_window.ParallelZeroWindow(processes)
+            seconds = time_call(parallel_call, (executor,), 1)
+            rows.append({"processes": processes, "seconds": seconds,
+                         "speedup": serial_seconds / seconds})
+            print(f"{name:30} processes={processes:>3} {seconds:10.4f}s "
+                  f"speedup {serial_seconds / seconds:6.2f}x")
+        report[name] = {"serial_seconds": serial_seconds,
+                        "serial_conversion_seconds": conversion_seconds,
+                        "parallel": rows}
+    return report
+
+'''
+Throughput (elements / sec) and peak memory of merging the sorted
+shards. The pairwise fold and the k-way merge build the output list,
+the external sort only streams it (consumed into an empty deque) so its
+peak memory reflects the run size and read buffers.
+'''
+def run_merge_report(size, shards, run_size, seed=0):
+    rng = random.Random(seed)
+    values = _random_ints(size, rng, 0, size)
+    shard_lists = [sorted(values[i::shards]) for i in range(shards)]
+    two_pointers = two_pointer.TwoPointers("benchmark")
+
+    def pairwise_fold():
+        merged = []
+        for shard in shard_lists:
+            merged = two_pointers.combine_sorted_array(merged, shard)
+        return merged
+
+    cases = {
+        "pairwise combine_sorted_array": pairwise_fold,
+        "merge_sorted_iterables": lambda: list(
+            two_pointers.merge_sorted_iterables(*shard_lists)),
+        "external_sort": lambda: deque(
+            two_pointers.external_sort(values, run_size=run_size),
+            maxlen=0),
+    }
+    report = {}
+    for name, call in cases.items():
+        seconds = time_call(call, (), 1)
+        peak_bytes = peak_memory(call, ())
+        report[name] = {"seconds": seconds, "throughput": size / seconds,
+                        "peak_bytes": peak_bytes}
+        print(f"{name:32} {seconds:10.4f}s {size / seconds:14.0f} elem/s "
+              f"{peak_bytes:>12} bytes")
+    return report
+
+'''
+In place reversal of byte payloads. The list path explodes the payload
+into one character strings like reverse_string expects; it takes about
+8 bytes per character so it is skipped above list_max_size.
+'''
+def run_reverse_report(sizes, list_max_size):
+    two_pointers = two_pointer.TwoPointers("benchmark")
+    numpy = two_pointer.np
+    report = {}
+    for size in sizes:
+        payload = bytearray(size)
+        cases = {
+            "bytearray": payload,
+            "memoryview": memoryview(payload),
+            "memoryview block 4096": memoryview(payload),
+            "array": array("B", bytes(size)),
+        }
+        if numpy is not None:
+            cases["numpy"] = numpy.zeros(size, dtype=numpy.uint8)
+        rows = {}
+        for name, buffer in cases.items():
+            block_size = 4096 if "block" in name else None
+            seconds = time_call(
+                lambda: two_pointers.reverse_buffer(
+                            buffer, block_size=block_size), (), 1)
+            rows[name] = {"seconds": seconds, "bytes_per_sec": size / seconds}
+        if ( size <= list_max_size ):
+            characters = ["a"] * size
+            seconds = time_call(two_pointers.reverse_string,
+                                (characters,), 1)
+            rows["list"] = {"seconds": seconds,
+                            "bytes_per_sec": size / seconds}
+            del characters
+        for name, row in rows.items():
+            print(f"{size:>12} bytes {name:24} {row['seconds']:10.4f}s "
+                  f"{row['bytes_per_sec'] / 2 ** 20:12.1f} MB/s")
+        report[str(size)] = rows
+        del cases, payload
+    return report
+
+'''
+End to end latency per event through AsyncSlidingWindow. A producer
+sends one value per event through an asyncio.Queue, or as one line per
+value over a local TCP socket with transport="socket". The window limit
+is never reached, so every event grows the longest window and publishes
+an update; latency is publish time minus send time of that event.
+rate=0 sends as fast as the consumer lets it.
+'''
+async def _async_latencies(events, rate, transport, max_pending):
+    window = sliding_window.AsyncSlidingWindow(max_pending)
+    send_times = [0.0] * events
+    interval = 1 / rate if rate else 0
+
+    async def produce(send):
+        for i in range(events):
+            send_times[i] = time.perf_counter()
+            await send(i)
+            await asyncio.sleep(interval)
+
+    async def consume(source):
+        latencies = []
+        async for _, _, end in window.longest_subarray_updates(source,
+                                                               events):
+            latencies.append(time.perf_counter() - send_times[end - 1])
+        return latencies
+
+    if ( transport == "queue" ):
+        queue = asyncio.Queue(max_pending)
+
+        async def queue_source():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                yield 1
+
+        async def send_all():
+            await produce(queue.put)
+            await queue.put(None)
+
+        producer = asyncio.create_task(send_all())
+        latencies = await consume(queue_source())
+        await producer
+        return latencies
+
+    async def handle(reader, writer):
+        async def send(_):
+            writer.write(b"1\n")
+            await writer.drain()
+        await produce(send)
+        writer.close()
+        await writer.wait_closed()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def socket_source():
+            async for line in reader:
+                yield int(line)
+
+        latencies = await consume(socket_source())
+        writer.close()
+        await writer.wait_closed()
+    return latencies
+
+def run_async_report(events, rate, transport, max_pending):
+    start = time.perf_counter()
+    latencies = asyncio.run(_async_latencies(events, rate, transport,
+                                             max_pending))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    report = {
+        "events": len(latencies),
+        "events_per_sec": len(latencies) / seconds,
+        "mean_seconds": sum(latencies) / len(latencies),
+        "p50_seconds": latencies[len(latencies) // 2],
+        "p99_seconds": latencies[min(len(latencies) - 1,
+                                     len(latencies) * 99 // 100)],
+    }
+    print(f"{transport} transport: {report['events_per_sec']:.0f} events/s "
+          f"p50 {report['p50_seconds'] * 1e6:.1f}us "
+          f"p99 {report['p99_seconds'] * 1e6:.1f}us")
+    return report
+
+'''
+Items / sec of the ragged batch methods against a loop over the single
+input methods. Packing the inputs into a flat buffer is done up front
+and not timed, since that is how a batch workload is stored.
+'''
+def run_batch_report(items, item_size, k, process_counts, seed=0):
+    rng = random.Random(seed)
+    sliding = sliding_window.SlidingWindow()
+    pointers = two_pointer.TwoPointers("benchmark")
+    ints = [_random_ints(item_size, rng, -100, 100) for _ in range(items)]
+    bits = [_random_bits(item_size, rng) for _ in range(items)]
+    strings = [bytes(rng.choice(b"ab") for _ in range(item_size))
+               for _ in range(items)]
+    sorted_ints = [sorted(item) for item in ints]
+
+    int_values, int_offsets = pack_ragged(ints)
+    bit_values, bit_offsets = pack_ragged(bits)
+    string_values, string_offsets = pack_ragged(strings, "B")
+    string_values = bytes(string_values)
+    sorted_values, sorted_offsets = pack_ragged(sorted_ints)
+
+    cases = {
+        "find_max_sum": (
+            lambda: [sliding.find_max_sum_in_fixed_sub_array(item, k)
+                     for item in ints],
+            lambda processes: sliding.find_max_sum_batch(
+                int_values, int_offsets, k, processes)),
+        "find_longest_ones": (
+            lambda: [sliding.find_longest_ones_in_list(item, k)
+                     for item in bits],
+            lambda processes: sliding.find_longest_ones_batch(
+                bit_values, bit_offsets, k, processes)),
+        "is_palindrome": (
+            lambda: [pointers.is_palindrome(item) for item in strings],
+            lambda processes: pointers.is_palindrome_batch(
+                string_values, string_offsets, processes)),
+        "check_for_target_sum": (
+            lambda: [pointers.check_for_target_sum(item, 0)
+                     for item in sorted_ints],
+            lambda processes: pointers.check_for_target_sum_batch(
+                sorted_values, sorted_offsets, 0, processes)),
+    }
+
+    report = {}
+    for name, (loop, batch) in cases.items():
+        seconds = time_call(loop, (), 1)
+        record = {"loop_items_per_sec": items / seconds, "batch": {}}
+        print(f"{name:22} loop          {items / seconds:14.0f} items/s")
+        for processes in process_counts:
+            seconds = time_call(batch, (processes,), 1)
+            record["batch"][processes] = items / seconds
+            speedup = record["batch"][processes] / record["loop_items_per_sec"]
+            print(f"{name:22} batch p={processes:<4} "
+                  f"{items / seconds:14.0f} items/s  x{speedup:.2f}")
+        report[name] = record
+    return report
+
+'''
+Operations / sec of DynamicFixedWindowMax against recomputing. The same
+seeded sequence of operations (40% update, 20% append, 20% pop_left,
+20% best window query) is replayed on both.
+'''
+def run_dynamic_report(size, k, operations, seed=0):
+    rng = random.Random(seed)
+    nums = _random_ints(size, rng, -100, 100)
+    steps = []
+    length = size
+    for _ in range(operations):
+        choice = rng.random()
+        if ( choice < 0.4 ):
+            steps.append(("update", rng.randrange(length),
+                          rng.randint(-100, 100)))
+        elif ( choice < 0.6 ):
+            steps.append(("append", rng.randint(-100, 100)))
+            length += 1
+        elif ( choice < 0.8 and length > k ):
+            steps.append(("pop_left",))
+            length -= 1
+        else:
+            steps.append(("best",))
+
+    def run_dynamic():
+        live_windows = sliding_window.DynamicFixedWindowMax(nums, k)
+        for step in steps:
+            if step[0] == "update":
+                live_windows.update(step[1], step[2])
+            elif step[0] == "append":
+                live_windows.append(step[1])
+            elif step[0] == "pop_left":
+                live_windows.pop_left()
+            else:
+                live_windows.best()
+
+    def run_recompute():
+        serial = sliding_window.SlidingWindow()
+        values = deque(nums)
+        for step in steps:
+            if step[0] == "update":
+                values[step[1]] = step[2]
+            elif step[0] == "append":
+                values.append(step[1])
+            elif step[0] == "pop_left":
+                values.popleft()
+            else:
+                serial.find_max_sum_in_fixed_sub_array(list(values), k)
+
+    report = {}
+    for name, run in (("dynamic", run_dynamic), ("recompute", run_recompute)):
+        seconds = time_call(run, (), 1)
+        report[name] = {"seconds": seconds,
+                        "operations_per_sec": operations / seconds}
+        print(f"{name:10} {operations / seconds:14.0f} operations/s")
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scaling = commands.add_parser("scaling",
+                                  help="asymptotic scaling benchmark")
+    scaling.add_argument("--methods", nargs="*",
+                         default=list(BENCHMARK_CASES),
+                         help="Class.method names to run")
+    scaling.add_argument("--min-size", type=int, default=DEFAULT_SIZES[0])
+    scaling.add_argument("--max-size", type=int, default=DEFAULT_SIZES[-1])
+    scaling.add_argument("--repeats", type=int, default=3)
+    scaling.add_argument("--output", default="benchmark_results.json")
+    scaling.add_argument("--baseline",
+                         help="results file to check for regressions")
+    scaling.add_argument("--threshold", type=float, default=0.25)
+
+    parallel = commands.add_parser("parallel",
+                                   help="ParallelZeroWindow speedup report")
+    parallel.add_argument("--size", type=int, default=10 ** 7)
+    parallel.add_argument("--k", type=int, default=10)
+    parallel.add_argument("--processes", type=int, nargs="*",
+                          default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parallel.add_argument("--output", default="parallel_results.json")
+
+    merge = commands.add_parser("merge",
+                                help="k-way merge and external sort report")
+    merge.add_argument("--size", type=int, default=10 ** 6)
+    merge.add_argument("--shards", type=int, default=100)
+    merge.add_argument("--run-size", type=int, default=1 << 16)
+    merge.add_argument("--output", default="merge_results.json")
+
+    reverse = commands.add_parser("reverse",
+                                  help="in place buffer reversal report")
+    reverse.add_argument("--sizes", type=int, nargs="*",
+                         default=[2 ** 20, 2 ** 24, 2 ** 28, 2 ** 30])
+    reverse.add_argument("--list-max-size", type=int, default=2 ** 24)
+    reverse.add_argument("--output", default="reverse_results.json")
+
+    async_parser = commands.add_parser(
+                        "async", help="AsyncSlidingWindow latency report")
+    async_parser.add_argument("--events", type=int, default=10 ** 5)
+    async_parser.add_argument("--rate", type=float, default=0,
+                              help="events per second, 0 for unthrottled")
+    async_parser.add_argument("--transport", choices=["queue", "socket"],
+                              default="queue")
+    async_parser.add_argument("--max-pending", type=int, default=1024)
+    async_parser.add_argument("--output", default="async_results.json")
+
+    batch = commands.add_parser("batch",
+                                help="ragged batch throughput report")
+    batch.add_argument("--items", type=int, default=10 ** 5)
+    batch.add_argument("--item-size", type=int, default=16)
+    batch.add_argument("--k", type=int, default=3)
+    batch.add_argument("--processes", type=int, nargs="*",
+                       default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    batch.add_argument("--output", default="batch_results.json")
+
+    dynamic = commands.add_parser("dynamic",
+                                  help="DynamicFixedWindowMax report")
+    dynamic.add_argument("--size", type=int, default=10 ** 5)
+    dynamic.add_argument("--k", type=int, default=100)
+    dynamic.add_argument("--operations", type=int, default=10 ** 4)
+    dynamic.add_argument("--output", default="dynamic_results.json")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "scaling":
+        unknown = set(args.methods) - set(BENCHMARK_CASES)
+        if unknown:
+            parser.error(f"unknown methods: {sorted(unknown)}")
+        sizes = [size for size in DEFAULT_SIZES
+                 if args.min_size <= size <= args.max_size]
+        results = run_scaling(args.methods, sizes, args.repeats)
+        with open(args.output, "w") as output:
+            json.dump({"python": platform.python_version(),
+                       "results": results}, output, indent=2)
+
+        for name, record in results.items():
+            exponent = record["exponent"]
+            exponent = "n/a" if exponent is None else f"{exponent:.2f}"
+            print(f"{name:50} exponent {exponent}")
+
+        if args.baseline:
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)["results"]
+            regressions = find_regressions(results, baseline,
+                                           args.threshold)
+            for regression in regressions:
+                print(f"REGRESSION {regression}")
+            if regressions:
+                return 1
+
+    elif args.command == "parallel":
+        report = run_parallel_report(args.size, args.k, args.processes)
+        with open(args.output, "w") as output:
+            json.dump({"python": platform.python_version(),
+                       "size": args.size, "k": args.k,
+                       "results": report}, output, indent=2)
+
+    elif args.command == "merge":
+        report = run_merge_report(args.size, args.shards, args.run_size)
+        with open(args.output, "w") as output:
+            json.dump({"python": platform.python_version(),
+                       "size": args.size, "shards": args.shards,
+                       "results": report}, output, indent=2)
+
+    elif args.command == "async":
+        report = run_async_report(args.events, args.rate, args.transport,
+                                  args.max_pending)
+        with open(args.output, "w") as output:
+            json.dump({"python": platform.python_version(),
+                       "transport": args.transport,
+                       "results": report}, output, indent=2)
+
+    elif args.command == "batch":
+        report = run_batch_report(args.items, args.item_size, args.k,
+                                  args.processes)
+        with open(args.output, "w") as output:
+            json.dump({"python": platform.python_version(),
+                       "items": args.items, "item_size": args.item_size,
+                       "results": report}, output, indent=2)
+
+    elif args.command == "dynamic":
+        report = run_dynamic_report(args.size, args.k, args.operations)
+        with open(args.output, "w") as output:
+            json.dump({"python": platform.python_version(),
+                       "size": args.size, "k": args.k,
+                       "operations": args.operations,
+                       "results": report}, output, indent=2)
+
+    elif args.command == "reverse":
+        report = run_reverse_report(args.sizes, args.list_max_size)
+        with open(args.output, "w") as output:
+            json.dump({"python": platform.python_version(),
+                       "results": report}, output, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,516 @@
 ''''
 This class will define the utility modules.
 '''
+import bisect
+import contextlib
+import copy
+import functools
+import importlib
+import importlib.util
+import itertools
 import logging as log
-def utility_decorator(func):
+import os
+import sys
+import time
+from array import array
+from collections import OrderedDict, deque
+
+# module logger, configured by the application; the module itself
+# never calls basicConfig.
+logger = log.getLogger(__name__)
+
+'''
+Heavy modules (numpy, asyncio, multiprocessing, hashing, pickling) are
+imported by the functions that use them, so importing the algorithm
+modules stays cheap for a short lived process such as Batch_Module.
+    * lazy_import(name) returns None when the module isn't installed,
+      otherwise a stand in that imports it on first attribute access.
+      That keeps the usual "np is None" fallback checks working.
+    * Before numpy has been imported by anyone no object can be an
+      ndarray, so np.ndarray is answered without importing numpy and
+      isinstance checks on plain lists stay free.
+'''
+class _NeverInstance:
+    pass
+
+class _LazyModule:
+
+    #Constructor method
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attribute):
+        module = sys.modules.get(self._name)
+        if module is None:
+            if ( attribute == "ndarray" ):
+                return _NeverInstance
+            module = importlib.import_module(self._name)
+        return getattr(module, attribute)
+
+def lazy_import(name):
+    if importlib.util.find_spec(name) is None:
+        return None
+    return _LazyModule(name)
+
+'''
+Instrumentation for the algorithm methods.
+    * utility_decorator marks a method as instrumented. While
+      instrumentation is off the class attribute is the plain function,
+      so a call is a direct call with no wrapper in between.
+    * enable_instrumentation() swaps in a timing wrapper on every
+      decorated method, disable_instrumentation() puts the plain
+      functions back. Setting ALGOS_INSTRUMENT=1 in the environment
+      turns it on at import time.
+    * The wrapper records call counts, latencies and input sizes in an
+      in-process registry that can be dumped as JSON or Prometheus text.
+'''
+
+# how many recent latencies are kept per method for the percentiles
+LATENCY_SAMPLE_SIZE = 10000
+
+#(owner class, attribute name, plain function, wrapper) of every
+#decorated method
+_instrumented_methods = []
+_instrumentation_enabled = os.environ.get("ALGOS_INSTRUMENT", "") not in ("", "0")
+
+# qualified method name -> MethodStats
+metrics_registry = {}
+
+class MethodStats:
+
+    #Constructor method
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.latencies = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self.total_input_size = 0
+        self.max_input_size = 0
+
+    def record(self, seconds, input_size):
+        self.calls += 1
+        self.total_seconds += seconds
+        self.latencies.append(seconds)
+        if input_size is not None:
+            self.total_input_size += input_size
+            self.max_input_size = max(self.max_input_size, input_size)
+
+    # nearest rank percentile over the recent latency samples
+    def percentile(self, percent):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(0, -(-len(ordered) * percent // 100) - 1)
+        return ordered[int(rank)]
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "p50_seconds": self.percentile(50),
+            "p99_seconds": self.percentile(99),
+            "total_input_size": self.total_input_size,
+            "max_input_size": self.max_input_size,
+        }
+
+# size of the first argument after self, if it has one.
+def _input_size(args):
+    if len(args) < 2:
+        return None
+    try:
+        return len(args[1])
+    except TypeError:
+        return None
+
+def _make_wrapper(func):
+    name = func.__qualname__
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        log.info("-" * 60)
-        log.info(f"Started {func.__name__} method")
-        # store the inner function valuecd 
+        start = time.perf_counter()
         value = func(*args, **kwargs)
-        log.info(f"Ended {func.__name__} message")
-        # return the inner func value 
-        log.info("-" * 60)
+        elapsed = time.perf_counter() - start
+
+        stats = metrics_registry.get(name)
+        if stats is None:
+            stats = metrics_registry[name] = MethodStats(name)
+        stats.record(elapsed, _input_size(args))
         return value
     return wrapper
+
+'''
+Placeholder stored in the class body by utility_decorator. When the class
+is created __set_name__ replaces it with either the plain function or
+the timing wrapper, so nothing of it is left on the call path.
+'''
+class _InstrumentedMethod:
+
+    def __init__(self, func):
+        self.func = func
+        self.wrapper = _make_wrapper(func)
+        functools.update_wrapper(self, func)
+
+    def __set_name__(self, owner, name):
+        _instrumented_methods.append((owner, name, self.func, self.wrapper))
+        setattr(owner, name,
+                self.wrapper if _instrumentation_enabled else self.func)
+
+    # only used if the decorator is put on a plain function.
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+def utility_decorator(func):
+    return _InstrumentedMethod(func)
+
+# Re-bind every decorated method to its wrapper or plain function.
+def _rebind_methods():
+    for owner, name, func, wrapper in _instrumented_methods:
+        setattr(owner, name,
+                wrapper if _instrumentation_enabled else func)
+
+def enable_instrumentation():
+    global _instrumentation_enabled
+    _instrumentation_enabled = True
+    _rebind_methods()
+    logger.debug("instrumentation enabled for %s methods",
+              len(_instrumented_methods))
+
+def disable_instrumentation():
+    global _instrumentation_enabled
+    _instrumentation_enabled = False
+    _rebind_methods()
+
+def instrumentation_enabled() -> bool:
+    return _instrumentation_enabled
+
+def reset_metrics():
+    metrics_registry.clear()
+
+def metrics_snapshot() -> dict:
+    return {name: stats.as_dict()
+            for name, stats in sorted(metrics_registry.items())}
+
+def dump_metrics_json(indent=None) -> str:
+    import json
+    return json.dumps(metrics_snapshot(), indent=indent)
+
+# Prometheus text exposition format. Samples of one metric family are
+# grouped under its TYPE line.
+def dump_metrics_prometheus(prefix="algos") -> str:
+    latency = f"{prefix}_method_latency_seconds"
+    size_total = f"{prefix}_method_input_size_total"
+    size_max = f"{prefix}_method_input_size_max"
+    methods = sorted(metrics_registry.items())
+
+    lines = [f"# TYPE {latency} summary"]
+    for name, stats in methods:
+        label = f'method="{name}"'
+        lines.append(f'{latency}{{{label},quantile="0.5"}} {stats.percentile(50)}')
+        lines.append(f'{latency}{{{label},quantile="0.99"}} {stats.percentile(99)}')
+        lines.append(f"{latency}_sum{{{label}}} {stats.total_seconds}")
+        lines.append(f"{latency}_count{{{label}}} {stats.calls}")
+
+    lines.append(f"# TYPE {size_total} counter")
+    for name, stats in methods:
+        lines.append(f'{size_total}{{method="{name}"}} {stats.total_input_size}')
+
+    lines.append(f"# TYPE {size_max} gauge")
+    for name, stats in methods:
+        lines.append(f'{size_max}{{method="{name}"}} {stats.max_input_size}')
+    return "\n".join(lines) + "\n"
+
+'''
+Shared memory helpers for the process pool executors.
+    * shared_buffers copies each buffer into a new shared memory segment
+      once and yields the segment names. Workers get the names instead of
+      the data, so nothing large is pickled.
+    * attach_shared_buffer is used inside a worker to map a segment by
+      name. Any memoryview taken from it must be released before the
+      context exits.
+'''
+@contextlib.contextmanager
+def shared_buffers(*buffers):
+    from multiprocessing import shared_memory
+
+    segments = []
+    try:
+        for buffer in buffers:
+            with memoryview(buffer) as view, view.cast("B") as data:
+                # zero sized segments are not allowed
+                segment = shared_memory.SharedMemory(
+                    create=True, size=max(1, data.nbytes))
+                segments.append(segment)
+                segment.buf[:data.nbytes] = data
+        yield [segment.name for segment in segments]
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+@contextlib.contextmanager
+def attach_shared_buffer(name):
+    from multiprocessing import shared_memory
+
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        yield segment.buf
+    finally:
+        segment.close()
+
+'''
+Batch helpers for many small inputs.
+    * A ragged batch is one flat buffer holding every input back to back
+      plus an offsets array: input i is values[offsets[i]:offsets[i+1]].
+      pack_ragged builds one from a list of lists.
+    * ragged_batch runs a kernel over every input and returns the results
+      in an array. A kernel is a plain module level function
+      kernel(values, offsets, first, last, *args) that loops over inputs
+      first to last-1 and returns an array of their results, with no
+      per input calls, checks or logging.
+    * With processes > 1 the buffers are copied into shared memory once
+      and the inputs are split into ranges of about the same number of
+      elements, one task per range.
+'''
+def pack_ragged(items, typecode : str = "q") -> tuple:
+    values = array(typecode)
+    offsets = array("q", [0])
+    for item in items:
+        values.extend(item)
+        offsets.append(len(values))
+    return values, offsets
+
+# values as something whose memoryview has the given typecode
+def _typed_buffer(values, typecode):
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    if typecode == "B" and isinstance(values, (bytes, bytearray)):
+        return values
+    if hasattr(values, "astype"):
+        typed = array(typecode)
+        typed.frombytes(values.astype(typecode).tobytes())
+        return typed
+    return array(typecode, values)
+
+# Run kernel over inputs first to last-1, reading the shared segments.
+def _ragged_chunk(kernel, names, typecode, value_count, item_count,
+                  first, last, args):
+    with attach_shared_buffer(names[0]) as values_buffer, \
+         attach_shared_buffer(names[1]) as offsets_buffer:
+        item_size = array(typecode).itemsize
+        with values_buffer[:value_count * item_size].cast(typecode) as values, \
+             offsets_buffer[:(item_count + 1) * 8].cast("q") as offsets:
+            return kernel(values, offsets, first, last, *args)
+
+def ragged_batch(kernel, values, offsets, args : tuple = (),
+                 typecode : str = "q", result_typecode : str = "q",
+                 processes : int = 1, chunks_per_process : int = 4) -> array:
+    values = _typed_buffer(values, typecode)
+    offsets = _typed_buffer(offsets, "q")
+    item_count = len(offsets) - 1
+    if ( item_count < 0 or offsets[0] != 0
+         or offsets[-1] != len(values) ):
+        raise ValueError("offsets must start at 0 and end at len(values)")
+    if any(start > stop for start, stop in zip(offsets, offsets[1:])):
+        raise ValueError("offsets must be non-decreasing")
+
+    processes = processes or os.cpu_count() or 1
+    if ( processes == 1 or item_count < 2 ):
+        with memoryview(values) as values_view, \
+             memoryview(offsets) as offsets_view:
+            return kernel(values_view, offsets_view, 0, item_count, *args)
+
+    # split on offsets so every range has about the same element count
+    chunk_count = min(item_count, processes * chunks_per_process)
+    bounds = [0]
+    for chunk in range(1, chunk_count):
+        target = len(values) * chunk // chunk_count
+        bounds.append(max(bounds[-1], bisect.bisect_left(offsets, target)))
+    bounds.append(item_count)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    results = array(result_typecode)
+    with shared_buffers(values, offsets) as names, \
+         ProcessPoolExecutor(processes) as pool:
+        futures = [pool.submit(_ragged_chunk, kernel, names, typecode,
+                               len(values), item_count, first, last, args)
+                   for first, last in zip(bounds, bounds[1:])
+                   if first < last]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+'''
+Opt-in memoization of the algorithm methods.
+    * Methods marked with @cacheable (put it under @utility_decorator)
+      are pure: same inputs, same result, inputs left untouched. Only
+      those are cached; anything that changes its arguments in place,
+      like reverse_string, always runs.
+    * ResultCache(maxsize).wrap(instance) returns a proxy of the
+      instance whose cacheable methods go through the cache.
+    * Inputs are fingerprinted cheaply: a blake2b digest of the buffer
+      for bytes-like objects, array.array and numpy arrays, the value
+      itself for small scalars and strings, and for VersionedList its
+      identity, length and a version bumped by every mutation through
+      its own methods (see VersionedList for what it can't see). Other values
+      (plain lists, tuples, dicts) are digested from their pickle.
+      Mutable buffers are digested on every call, so a mutated input
+      never hits a stale result.
+    * Results are kept in a size bounded LRU with hit / miss / eviction
+      counts. Mutable results are copied on the way out so callers
+      can't change what is cached.
+'''
+def cacheable(func):
+    func.cacheable = True
+    return func
+
+'''
+list that counts its own mutations, so ResultCache can key it on
+identity plus version instead of digesting the contents on every call.
+Only the list methods overridden below bump the version. C code that
+writes to the list directly bypasses them: heapq.heappush and friends,
+bisect.insort, or list.__setitem__ called as list.__setitem__(vl, ...).
+The length is part of the key too, which catches changes that add or
+remove items, but an in place change through those functions (such as
+heapq.heapreplace) is not seen. Use a plain list for data mutated that
+way, or call vl.touch() after changing it.
+'''
+class VersionedList(list):
+
+    _tokens = itertools.count()
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        #unique for the life of the process, unlike id()
+        self.token = next(VersionedList._tokens)
+        self.version = 0
+
+    # Mark the list changed after a mutation the version doesn't track.
+    def touch(self):
+        self.version += 1
+
+def _bump_version(name):
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def mutator(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return mutator
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__",
+              "append", "extend", "insert", "pop", "remove", "clear",
+              "sort", "reverse"):
+    setattr(VersionedList, _name, _bump_version(_name))
+
+# strings up to this length are used as keys directly, longer ones are
+# digested so the cache doesn't keep them alive.
+_INLINE_STRING_LENGTH = 1024
+
+def _digest(data) -> bytes:
+    import hashlib
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+# Hashable key for one argument, or TypeError if it can't be keyed.
+def _fingerprint(value):
+    if value is None or isinstance(value, (bool, int, float, complex)):
+        return (type(value).__name__, value)
+    if isinstance(value, str):
+        if ( len(value) <= _INLINE_STRING_LENGTH ):
+            return ("str", value)
+        return ("str", _digest(value.encode("utf-8", "surrogatepass")))
+    if isinstance(value, VersionedList):
+        return ("versioned_list", value.token, value.version, len(value))
+    if isinstance(value, (bytes, bytearray, memoryview, array)):
+        with memoryview(value) as view:
+            return (type(value).__name__, view.format, view.shape,
+                    _digest(view.tobytes() if not view.contiguous
+                            else view.cast("B")))
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return ("ndarray", value.dtype.str, value.shape,
+                _digest(numpy.ascontiguousarray(value).data.cast("B")))
+    import pickle
+    try:
+        return (type(value).__name__,
+                _digest(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+    except Exception as error:
+        raise TypeError(f"can't fingerprint {type(value).__name__}") from error
+
+def _copy_result(result):
+    if isinstance(result, (list, dict, set, bytearray, array)):
+        return copy.copy(result)
+    if hasattr(result, "copy") and hasattr(result, "dtype"):
+        return result.copy()
+    # tuples like (series, best_index, best_value) hold mutable items
+    if isinstance(result, tuple):
+        items = [_copy_result(item) for item in result]
+        if all(item is original for item, original in zip(items, result)):
+            return result
+        if hasattr(result, "_fields"):
+            return type(result)(*items)
+        return tuple(items)
+    return result
+
+class ResultCache:
+
+    #Constructor method
+    def __init__(self, maxsize : int = 128):
+        if ( maxsize <= 0 ):
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = self.misses = self.evictions = self.uncacheable = 0
+
+    # Proxy of instance whose cacheable methods use this cache.
+    def wrap(self, instance):
+        return _CachedInstance(self, instance)
+
+    def call(self, method, args, kwargs):
+        try:
+            key = (method.__qualname__,
+                   tuple(_fingerprint(arg) for arg in args),
+                   tuple(sorted((name, _fingerprint(value))
+                                for name, value in kwargs.items())))
+        except TypeError:
+            self.uncacheable += 1
+            return method(*args, **kwargs)
+
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return _copy_result(self.entries[key])
+
+        self.misses += 1
+        result = method(*args, **kwargs)
+        self.entries[key] = result
+        if ( len(self.entries) > self.maxsize ):
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return _copy_result(result)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable,
+                "size": len(self.entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        self.entries.clear()
+
+class _CachedInstance:
+
+    def __init__(self, cache, instance):
+        self._cache = cache
+        self._instance = instance
+
+    def __getattr__(self, name):
+        attribute = getattr(self._instance, name)
+        method = getattr(type(self._instance), name, None)
+        if not getattr(method, "cacheable", False):
+            return attribute
+
+        @functools.wraps(method)
+        def cached_method(*args, **kwargs):
+            return self._cache.call(attribute, args, kwargs)
+        return cached_method